@@ -0,0 +1,25 @@
+from typing import (
+    TYPE_CHECKING,
+    Annotated,
+)
+
+from fastapi import (
+    APIRouter,
+    Depends,
+)
+
+from app.core.responses import ModelJSONResponse
+from app.services.admin import get_query_stats
+
+
+if TYPE_CHECKING:
+    from app.schemas.response import ResponseModel
+
+router = APIRouter(prefix='/admin')
+
+
+@router.get('/queries')
+async def list_query_stats(
+    result: Annotated['ResponseModel', Depends(get_query_stats)],
+) -> ModelJSONResponse:
+    return ModelJSONResponse(result)
@@ -7,8 +7,8 @@ from fastapi import (
     APIRouter,
     Depends,
 )
-from fastapi.responses import JSONResponse
 
+from app.core.responses import ModelJSONResponse
 from app.services.apikey import create_api_key
 
 
@@ -21,8 +21,5 @@ router = APIRouter(prefix='/apikeys')
 @router.post('')
 async def check_health(
     result: Annotated['ResponseModel', Depends(create_api_key)],
-) -> JSONResponse:
-    return JSONResponse(
-        status_code=result.status,
-        content=result.model_dump(exclude_none=True),
-    )
+) -> ModelJSONResponse:
+    return ModelJSONResponse(result)
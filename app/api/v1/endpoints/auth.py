@@ -7,8 +7,8 @@ from fastapi import (
     APIRouter,
     Depends,
 )
-from fastapi.responses import JSONResponse
 
+from app.core.responses import ModelJSONResponse
 from app.services.auth import generate_access_token
 
 
@@ -21,8 +21,5 @@ router = APIRouter(prefix='/oauth')
 @router.post(path='/token')
 async def generate_tokens(
     result: Annotated['ResponseModel', Depends(generate_access_token)],
-) -> JSONResponse:
-    return JSONResponse(
-        status_code=result.status,
-        content=result.model_dump(exclude_none=True),
-    )
+) -> ModelJSONResponse:
+    return ModelJSONResponse(result)
@@ -7,9 +7,13 @@ from fastapi import (
     APIRouter,
     Depends,
 )
-from fastapi.responses import JSONResponse
 
-from app.services.health import health_check_v1
+from app.core.responses import ModelJSONResponse
+from app.services.health import (
+    diagnostics_v1,
+    liveness_check_v1,
+    readiness_check_v1,
+)
 
 
 if TYPE_CHECKING:
@@ -19,10 +23,22 @@ router = APIRouter(prefix='/health')
 
 
 @router.get('')
-def check_health(
-    result: Annotated['ResponseModel', Depends(health_check_v1)],
-) -> JSONResponse:
-    return JSONResponse(
-        status_code=result.status,
-        content=result.model_dump(exclude_none=True),
-    )
+@router.get('/ready')
+async def check_readiness(
+    result: Annotated['ResponseModel', Depends(readiness_check_v1)],
+) -> ModelJSONResponse:
+    return ModelJSONResponse(result)
+
+
+@router.get('/live')
+async def check_liveness(
+    result: Annotated['ResponseModel', Depends(liveness_check_v1)],
+) -> ModelJSONResponse:
+    return ModelJSONResponse(result)
+
+
+@router.get('/diagnostics')
+async def get_diagnostics(
+    result: Annotated['ResponseModel', Depends(diagnostics_v1)],
+) -> ModelJSONResponse:
+    return ModelJSONResponse(result)
@@ -0,0 +1,20 @@
+from typing import Annotated
+
+from fastapi import (
+    APIRouter,
+    Depends,
+)
+from fastapi.responses import Response
+
+from app.core.prometheus import CONTENT_TYPE
+from app.services.metrics import get_metrics_v1
+
+
+router = APIRouter(prefix='/metrics')
+
+
+@router.get('')
+async def get_metrics(
+    result: Annotated[str, Depends(get_metrics_v1)],
+) -> Response:
+    return Response(content=result, media_type=CONTENT_TYPE)
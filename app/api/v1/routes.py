@@ -1,9 +1,11 @@
 from fastapi import APIRouter
 
 from app.api.v1.endpoints import (
+    admin_router,
     apikey_router,
     auth_router,
     health_router,
+    metrics_router,
 )
 
 
@@ -13,3 +15,5 @@ api_version_prefix: str = '/v1'
 router.include_router(health_router, prefix=api_version_prefix)
 router.include_router(auth_router, prefix=api_version_prefix)
 router.include_router(apikey_router, prefix=api_version_prefix)
+router.include_router(admin_router, prefix=api_version_prefix)
+router.include_router(metrics_router, prefix=api_version_prefix)
@@ -1,8 +1,10 @@
+from app.configs.cache import settings as cache_configs
 from app.configs.core import settings as core_configs
 from app.configs.db import settings as db_configs
 
 
 __all__ = [
+    'cache_configs',
     'core_configs',
     'db_configs',
 ]
@@ -0,0 +1,56 @@
+from pydantic import Field
+from pydantic_settings import (
+    BaseSettings,
+    SettingsConfigDict,
+)
+
+
+class Settings(BaseSettings):
+    model_config = SettingsConfigDict(
+        env_file=('.env', '.env.local'),
+        env_file_encoding='utf-8',
+        extra='ignore',
+        case_sensitive=True,
+    )
+
+    token_cache_enabled: bool = Field(
+        validation_alias='TOKEN_CACHE_ENABLED',
+        default=True,
+    )
+    token_cache_size: int = Field(
+        validation_alias='TOKEN_CACHE_SIZE',
+        default=10_000,
+    )
+
+    user_cache_enabled: bool = Field(
+        validation_alias='USER_CACHE_ENABLED',
+        default=True,
+    )
+    user_cache_size: int = Field(
+        validation_alias='USER_CACHE_SIZE',
+        default=10_000,
+    )
+    user_cache_ttl: int = Field(
+        validation_alias='USER_CACHE_TTL',
+        default=30,  # in seconds
+    )
+
+    api_key_cache_enabled: bool = Field(
+        validation_alias='API_KEY_CACHE_ENABLED',
+        default=True,
+    )
+    api_key_cache_size: int = Field(
+        validation_alias='API_KEY_CACHE_SIZE',
+        default=1_000,
+    )
+    api_key_cache_ttl: int = Field(
+        validation_alias='API_KEY_CACHE_TTL',
+        default=60,  # in seconds
+    )
+    api_key_negative_cache_ttl: int = Field(
+        validation_alias='API_KEY_NEGATIVE_CACHE_TTL',
+        default=10,  # in seconds
+    )
+
+
+settings = Settings()
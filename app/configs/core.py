@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic import Field
 from pydantic_settings import (
     BaseSettings,
@@ -13,7 +15,10 @@ class Settings(BaseSettings):
         case_sensitive=True,
     )
 
-    token_algorithm: str = Field(default='ES256')
+    token_algorithm: Literal['ES256', 'EdDSA', 'HS256'] = Field(
+        validation_alias='TOKEN_ALGORITHM',
+        default='ES256',
+    )
     password_regex: str = Field(
         default=r'^(?=.*?[A-Z])(?=.*?[a-z])(?=.*?[0-9])(?=.*?[#?!@$%^&*-]).{8,}$'
     )
@@ -26,6 +31,10 @@ class Settings(BaseSettings):
         validation_alias='REQUEST_ID_CTX_KEY',
         default='request_id',
     )
+    request_id_header: str = Field(
+        validation_alias='REQUEST_ID_HEADER',
+        default='X-Request-ID',
+    )
     access_token_exp_delta: int = Field(
         validation_alias='ACCESS_TOKEN_EXP_DELTA',
         default=60 * 24,  # in minutes
@@ -43,8 +52,85 @@ class Settings(BaseSettings):
         default='api:appname',
     )
 
-    public_key: str = Field(validation_alias='PUBLIC_KEY')
-    private_key: str = Field(validation_alias='PRIVATE_KEY')
+    password_hash_executor: Literal['thread', 'process'] = Field(
+        validation_alias='PASSWORD_HASH_EXECUTOR',
+        default='thread',
+    )
+    password_hash_workers: int = Field(
+        validation_alias='PASSWORD_HASH_WORKERS',
+        default=2,
+    )
+    password_hash_queue_size: int = Field(
+        validation_alias='PASSWORD_HASH_QUEUE_SIZE',
+        default=64,
+    )
+    password_hash_timeout: float = Field(
+        validation_alias='PASSWORD_HASH_TIMEOUT',
+        default=5.0,  # in seconds
+    )
+
+    token_key_id: str | None = Field(
+        validation_alias='TOKEN_KEY_ID',
+        default=None,
+    )
+    token_signing_key_id: str | None = Field(
+        validation_alias='TOKEN_SIGNING_KEY_ID',
+        default=None,
+    )
+    token_keys_dir: str | None = Field(
+        validation_alias='TOKEN_KEYS_DIR',
+        default=None,
+    )
+    token_keys_reload_interval: float = Field(
+        validation_alias='TOKEN_KEYS_RELOAD_INTERVAL',
+        default=60.0,  # in seconds
+    )
+
+    system_metrics_interval: float = Field(
+        validation_alias='SYSTEM_METRICS_INTERVAL',
+        default=5.0,  # in seconds
+    )
+    system_metrics_window: int = Field(
+        validation_alias='SYSTEM_METRICS_WINDOW',
+        default=12,  # number of samples averaged
+    )
+
+    loop_monitor_enabled: bool = Field(
+        validation_alias='LOOP_MONITOR_ENABLED',
+        default=True,
+    )
+    loop_monitor_interval: float = Field(
+        validation_alias='LOOP_MONITOR_INTERVAL',
+        default=0.1,  # in seconds
+    )
+    loop_lag_threshold_ms: float = Field(
+        validation_alias='LOOP_LAG_THRESHOLD_MS',
+        default=100.0,
+    )
+
+    metrics_dir: str | None = Field(
+        validation_alias='METRICS_DIR',
+        default=None,  # shared by all workers, files of earlier runs are pruned
+    )
+    metrics_flush_interval: float = Field(
+        validation_alias='METRICS_FLUSH_INTERVAL',
+        default=5.0,  # in seconds
+    )
+
+    diagnostics_rate_limit: float = Field(
+        validation_alias='DIAGNOSTICS_RATE_LIMIT',
+        default=1.0,  # requests per second
+        gt=0,
+    )
+    diagnostics_burst: int = Field(
+        validation_alias='DIAGNOSTICS_BURST',
+        default=5,
+        ge=1,
+    )
+
+    public_key: str | None = Field(validation_alias='PUBLIC_KEY', default=None)
+    private_key: str | None = Field(validation_alias='PRIVATE_KEY', default=None)
+    token_secret: str | None = Field(validation_alias='TOKEN_SECRET', default=None)
 
 
 settings = Settings()  # type: ignore[missing-arguments]
@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic import Field
 from pydantic_settings import (
     BaseSettings,
@@ -19,5 +21,76 @@ class Settings(BaseSettings):
     db_pw: str = Field(validation_alias='PG_PASSWORD')
     db_name: str = Field(validation_alias='PG_DB')
 
+    db_replica_hosts: list[str] = Field(
+        validation_alias='PG_REPLICA_HOSTS',
+        default_factory=list,  # JSON list of 'host' or 'host:port' entries
+    )
+    db_replica_cooldown: float = Field(
+        validation_alias='PG_REPLICA_COOLDOWN',
+        default=30.0,  # in seconds
+    )
+
+    db_pool_size: int = Field(validation_alias='PG_POOL_SIZE', default=5)
+    db_max_overflow: int = Field(validation_alias='PG_MAX_OVERFLOW', default=10)
+    db_pool_timeout: float = Field(
+        validation_alias='PG_POOL_TIMEOUT',
+        default=30.0,  # in seconds
+    )
+    db_pool_recycle: int = Field(
+        validation_alias='PG_POOL_RECYCLE',
+        default=-1,  # in seconds, -1 disables recycling
+    )
+    db_pool_pre_ping: bool = Field(validation_alias='PG_POOL_PRE_PING', default=False)
+    db_server_settings: dict[str, str] = Field(
+        validation_alias='PG_SERVER_SETTINGS',
+        default_factory=dict,  # JSON object, e.g. {"application_name": "api"}
+    )
+    db_prepared_statement_cache_size: int = Field(
+        validation_alias='PG_PREPARED_STATEMENT_CACHE_SIZE',
+        default=100,  # per connection, 0 disables the cache
+    )
+    db_query_cache_size: int = Field(
+        validation_alias='PG_QUERY_CACHE_SIZE',
+        default=500,  # compiled statements per engine, 0 disables the cache
+    )
+
+    slow_query_threshold_ms: float = Field(
+        validation_alias='SLOW_QUERY_THRESHOLD_MS',
+        default=200.0,
+    )
+    query_stats_max_fingerprints: int = Field(
+        validation_alias='QUERY_STATS_MAX_FINGERPRINTS',
+        default=1_000,
+    )
+
+    # 'raise' fails the request with a 500 listing the call sites; meant for
+    # development and tests, not production
+    repeated_query_detection: Literal['off', 'log', 'raise'] = Field(
+        validation_alias='REPEATED_QUERY_DETECTION',
+        default='off',
+    )
+    repeated_query_threshold: int = Field(
+        validation_alias='REPEATED_QUERY_THRESHOLD',
+        default=10,
+    )
+
+    readiness_probe_interval: float = Field(
+        validation_alias='READINESS_PROBE_INTERVAL',
+        default=5.0,  # in seconds
+    )
+    readiness_probe_timeout: float = Field(
+        validation_alias='READINESS_PROBE_TIMEOUT',
+        default=2.0,  # in seconds
+    )
+
+    api_key_usage_flush_interval: float = Field(
+        validation_alias='API_KEY_USAGE_FLUSH_INTERVAL',
+        default=10.0,  # in seconds
+    )
+    api_key_usage_batch_size: int = Field(
+        validation_alias='API_KEY_USAGE_BATCH_SIZE',
+        default=500,
+    )
+
 
 settings = Settings()  # type: ignore[missing-arguments]
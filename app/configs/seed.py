@@ -17,5 +17,12 @@ class Settings(BaseSettings):
     username: str = Field(validation_alias='SEED_USER_USERNAME')
     password: str = Field(validation_alias='SEED_USER_PASSWORD')
 
+    # an API key holding the 'admin' scope, which the API cannot grant
+    admin_api_key: str | None = Field(validation_alias='SEED_ADMIN_API_KEY', default=None)
+    admin_service_name: str = Field(
+        validation_alias='SEED_ADMIN_SERVICE_NAME',
+        default='admin-svc',
+    )
+
 
 settings = Settings()  # type: ignore[missing-arguments]
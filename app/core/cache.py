@@ -1,11 +1,125 @@
+from collections.abc import MutableMapping
 from typing import Any
 
 from cachetools import TTLCache
 
+from app.core.prometheus import (
+    MetricsSnapshot,
+    register_collector,
+)
+
 
 _cache = TTLCache(maxsize=1024, ttl=15)
 
 
+class MeteredCache[K, V]:
+    """Thin wrapper around a `cachetools` cache that counts hits and misses.
+
+    The wrapped cache decides the eviction policy (LRU, TTL, per-item TTL).
+    When the cache is disabled every lookup is reported as a bypass and
+    nothing is stored, which allows caching to be switched off without
+    changing the call sites.
+    """
+
+    __slots__ = ('_cache', 'bypasses', 'enabled', 'hits', 'misses', 'name')
+
+    def __init__(
+        self,
+        name: str,
+        cache: MutableMapping[K, V],
+        *,
+        enabled: bool = True,
+    ) -> None:
+        """Initialize the wrapper and register it for stats reporting.
+
+        Args:
+            name: Unique name used when reporting cache statistics.
+            cache: The underlying cache instance.
+            enabled: Whether lookups and stores are performed at all.
+        """
+        self.name = name
+        self.enabled = enabled
+        self.hits: int = 0
+        self.misses: int = 0
+        self.bypasses: int = 0
+        self._cache = cache
+
+        _registry[name] = self
+
+    def get(self, key: K) -> V | None:
+        """Look up a value, updating the hit and miss counters.
+
+        Args:
+            key: The cache key to look up.
+
+        Returns:
+            The cached value if present and not expired; otherwise, None.
+        """
+        if not self.enabled:
+            self.bypasses += 1
+            return None
+
+        value = self._cache.get(key)
+
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        """Store a value unless the cache is disabled.
+
+        Args:
+            key: The cache key used to store the value.
+            value: The value to be stored in the cache.
+        """
+        if self.enabled:
+            self._cache[key] = value
+
+    def pop(self, key: K) -> V | None:
+        """Remove a value from the cache.
+
+        Args:
+            key: The cache key to invalidate.
+
+        Returns:
+            The removed value, or None if the key was not cached.
+        """
+        return self._cache.pop(key, None)
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        return len(self._cache)
+
+    def clear(self) -> None:
+        """Remove every entry from the cache."""
+        self._cache.clear()
+
+    def stats(self) -> dict:
+        """Return the cache counters and current size.
+
+        Returns:
+            A dictionary with the hit, miss and bypass counters, the hit
+            ratio and the current and maximum number of entries.
+        """
+        lookups: int = self.hits + self.misses
+
+        return {
+            'enabled': self.enabled,
+            'size': len(self._cache),
+            'maxsize': getattr(self._cache, 'maxsize', None),
+            'hits': self.hits,
+            'misses': self.misses,
+            'bypasses': self.bypasses,
+            'hit_ratio': round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+_registry: dict[str, MeteredCache] = {}
+
+
 def set_cache(key: str, value: Any) -> None:  # noqa: ANN401
     """Store a value in the cache under the specified key.
 
@@ -35,7 +149,46 @@ def read_cache(key: str) -> Any:  # noqa: ANN401
     return _cache[key]
 
 
+def get_cache_stats() -> dict[str, dict]:
+    """Collect statistics for every registered `MeteredCache`.
+
+    Returns:
+        A dictionary mapping each cache name to its statistics.
+    """
+    return {name: cache.stats() for name, cache in _registry.items()}
+
+
+@register_collector
+def collect_cache_metrics(snapshot: MetricsSnapshot) -> None:
+    """Add the counters of every registered `MeteredCache` to a snapshot.
+
+    Args:
+        snapshot: The snapshot to add the metrics to.
+    """
+    for name, cache in _registry.items():
+        snapshot.counter(
+            'cache_hits_total',
+            'Cache lookups served from the cache.',
+            cache.hits,
+            cache=name,
+        )
+        snapshot.counter(
+            'cache_misses_total',
+            'Cache lookups not found in the cache.',
+            cache.misses,
+            cache=name,
+        )
+        snapshot.gauge(
+            'cache_entries',
+            'Entries currently held by the cache.',
+            len(cache),
+            cache=name,
+        )
+
+
 __all__ = [
+    'MeteredCache',
+    'get_cache_stats',
     'set_cache',
     'read_cache',
 ]
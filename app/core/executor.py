@@ -0,0 +1,179 @@
+import asyncio
+import logging
+
+from collections.abc import Callable
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from time import monotonic_ns
+from typing import Literal
+
+from app.configs import core_configs
+from app.core.metrics import Histogram
+from app.errors.domain import (
+    WorkerPoolBusyError,
+    WorkerPoolTimeoutError,
+)
+
+
+logger = logging.getLogger(core_configs.logger_name)
+
+
+type ExecutorKind = Literal['thread', 'process']
+
+
+def _timed_call[T](fn: Callable[..., T], *args: object) -> tuple[int, int, T]:
+    """Run a callable inside a worker and record when it started and finished.
+
+    `monotonic_ns` is backed by a system-wide clock, so the timestamps are
+    comparable with the ones taken by the event loop even when the call runs
+    in a separate process.
+
+    Args:
+        fn: The callable to run. Must be picklable for process pools.
+        *args: Positional arguments passed to `fn`.
+
+    Returns:
+        A tuple of the start timestamp, the finish timestamp and the result.
+    """
+    started_ns: int = monotonic_ns()
+    result = fn(*args)
+    return started_ns, monotonic_ns(), result
+
+
+class BoundedExecutor:
+    """Thread or process pool with a bounded queue for CPU bound work.
+
+    Callables submitted through `run` are executed outside of the event loop.
+    The number of in-flight calls is capped at `max_workers + queue_size`;
+    calls beyond that are rejected immediately instead of piling up, and each
+    call is bounded by `timeout` seconds. The underlying pool is created
+    lazily on first use.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        kind: ExecutorKind,
+        max_workers: int,
+        queue_size: int,
+        timeout: float,
+    ) -> None:
+        """Initialize the executor without starting any workers.
+
+        Args:
+            name: Name used in logs and error messages.
+            kind: Either 'thread' or 'process'.
+            max_workers: Number of workers in the pool.
+            queue_size: Number of calls allowed to wait for a free worker.
+            timeout: Maximum number of seconds a call may take, queueing
+                included.
+        """
+        self.name = name
+        self.kind = kind
+        self.max_workers = max_workers
+        self.queue_size = queue_size
+        self.timeout = timeout
+
+        self._executor: Executor | None = None
+        self._in_flight: int = 0
+
+        self.wait_time_ms = Histogram()
+        self.run_time_ms = Histogram()
+        self.completed: int = 0
+        self.rejected: int = 0
+        self.timed_out: int = 0
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.kind == 'process':
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix=self.name,
+                )
+
+        return self._executor
+
+    def _release(self) -> None:
+        self._in_flight -= 1
+
+    async def run[T](self, fn: Callable[..., T], /, *args: object) -> T:
+        """Run a callable in the pool and await its result.
+
+        Args:
+            fn: The callable to run. Must be picklable for process pools.
+            *args: Positional arguments passed to `fn`.
+
+        Returns:
+            The value returned by `fn`.
+
+        Raises:
+            WorkerPoolBusyError: If the pool queue is full.
+            WorkerPoolTimeoutError: If the call did not finish in time.
+        """
+        if self._in_flight >= self.max_workers + self.queue_size:
+            self.rejected += 1
+            msg: str = f'{self.name} worker pool is busy'
+            raise WorkerPoolBusyError(msg)
+
+        loop = asyncio.get_running_loop()
+        submitted_ns: int = monotonic_ns()
+
+        self._in_flight += 1
+        future = self._get_executor().submit(_timed_call, fn, *args)
+        # The slot is only freed once the worker is really done, so calls that
+        # timed out keep counting against the queue while they still run.
+        future.add_done_callback(lambda _: loop.call_soon_threadsafe(self._release))
+
+        try:
+            started_ns, finished_ns, result = await asyncio.wait_for(
+                asyncio.wrap_future(future), timeout=self.timeout
+            )
+        except TimeoutError as e:
+            self.timed_out += 1
+            msg: str = f'{self.name} worker pool call timed out'
+            raise WorkerPoolTimeoutError(msg) from e
+
+        self.completed += 1
+        self.wait_time_ms.observe((started_ns - submitted_ns) / 1_000_000)
+        self.run_time_ms.observe((finished_ns - started_ns) / 1_000_000)
+
+        return result
+
+    def stats(self) -> dict:
+        """Return a snapshot of the pool utilization metrics.
+
+        Returns:
+            A dictionary with the pool configuration, the current in-flight
+            and queued call counts, completion counters and the wait and run
+            time distributions in milliseconds.
+        """
+        return {
+            'kind': self.kind,
+            'max_workers': self.max_workers,
+            'queue_size': self.queue_size,
+            'in_flight': self._in_flight,
+            'queue_length': max(0, self._in_flight - self.max_workers),
+            'completed': self.completed,
+            'rejected': self.rejected,
+            'timed_out': self.timed_out,
+            'wait_time_ms': self.wait_time_ms.snapshot(),
+            'run_time_ms': self.run_time_ms.snapshot(),
+        }
+
+    async def shutdown(self) -> None:
+        """Stop the pool, dropping calls that have not started yet."""
+        if self._executor is None:
+            return
+
+        logger.info('Shutting down %s worker pool', self.name)
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._executor = None
+
+
+__all__ = ['BoundedExecutor']
@@ -0,0 +1,343 @@
+import asyncio
+import base64
+import hashlib
+import logging
+
+from contextlib import suppress
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Final
+
+from cryptography.hazmat.primitives.serialization import (
+    Encoding,
+    PublicFormat,
+    load_pem_private_key,
+    load_pem_public_key,
+)
+
+from app.configs.core import settings
+from app.core.lifespan import (
+    on_shutdown,
+    on_startup,
+)
+from app.errors.domain import TokenError
+
+
+logger = logging.getLogger(settings.logger_name)
+
+
+SYMMETRIC_ALGORITHMS: Final[frozenset[str]] = frozenset({'HS256'})
+
+
+@dataclass(frozen=True, slots=True)
+class JwtKey:
+    """A parsed key pair used to sign or verify tokens.
+
+    Attributes:
+        kid: Key identifier written to and read from the `kid` JWT header.
+        public_key: The parsed verification key.
+        private_key: The parsed signing key, or None for verify-only keys.
+    """
+
+    kid: str
+    public_key: object
+    private_key: object | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class _KeyRingState:
+    default_key: JwtKey
+    signing_key: JwtKey
+    verify_keys: dict[str, JwtKey]
+    fingerprint: tuple[tuple[str, int], ...]
+
+
+def _key_id(public_key: object) -> str:
+    """Derive a stable key identifier from the DER encoded public key.
+
+    Args:
+        public_key: A parsed `cryptography` public key.
+
+    Returns:
+        The first 16 hex characters of the SHA-256 digest of the key.
+    """
+    der: bytes = public_key.public_bytes(  # type: ignore[attr-defined]
+        encoding=Encoding.DER,
+        format=PublicFormat.SubjectPublicKeyInfo,
+    )
+    return hashlib.sha256(der).hexdigest()[:16]
+
+
+def _load_pem_file(path: Path) -> JwtKey:
+    """Parse a PEM file holding either a private or a public key.
+
+    The file stem is used as the key identifier.
+
+    Args:
+        path: Path to the PEM file.
+
+    Returns:
+        The parsed key. Private key files yield a signing capable key.
+    """
+    pem: bytes = path.read_bytes()
+
+    if b'PRIVATE KEY' in pem:
+        private_key = load_pem_private_key(pem, password=None)
+        return JwtKey(
+            kid=path.stem,
+            public_key=private_key.public_key(),
+            private_key=private_key,
+        )
+
+    return JwtKey(kid=path.stem, public_key=load_pem_public_key(pem))
+
+
+class KeyRing:
+    """Parsed signing and verification keys for JWT handling.
+
+    The key configured through `PRIVATE_KEY`/`PUBLIC_KEY` (or `TOKEN_SECRET`
+    for HMAC algorithms) is always part of the ring. When `TOKEN_KEYS_DIR`
+    is set, every `*.pem` file in it is added as well, keyed by its file
+    stem: private key files can be selected for signing with
+    `TOKEN_SIGNING_KEY_ID`, public key files keep older keys valid for
+    verification while tokens signed with them are still alive.
+
+    Keys are parsed once and the whole state is swapped atomically on
+    reload, so the hot path only performs a dictionary lookup.
+    """
+
+    def __init__(self, algorithm: str, keys_dir: Path | None) -> None:
+        """Initialize an empty key ring. Keys are loaded on first use.
+
+        Args:
+            algorithm: The JWT algorithm the keys are meant for.
+            keys_dir: Optional directory holding additional PEM keys.
+        """
+        self.algorithm = algorithm
+        self._state: _KeyRingState | None = None
+        self._keys_dir = keys_dir
+        self._reload_task: asyncio.Task | None = None
+
+    def _fingerprint(self) -> tuple[tuple[str, int], ...]:
+        if self._keys_dir is None or not self._keys_dir.is_dir():
+            return ()
+
+        return tuple(
+            sorted(
+                (path.name, path.stat().st_mtime_ns)
+                for path in self._keys_dir.glob('*.pem')
+            )
+        )
+
+    def _load_default_key(self) -> JwtKey:
+        if self.algorithm in SYMMETRIC_ALGORITHMS:
+            if not settings.token_secret:
+                msg: str = f'TOKEN_SECRET is required for {self.algorithm} tokens'
+                raise ValueError(msg)
+
+            secret: bytes = base64.b64decode(settings.token_secret)
+            return JwtKey(
+                kid=settings.token_key_id or 'default',
+                public_key=secret,
+                private_key=secret,
+            )
+
+        if not settings.private_key or not settings.public_key:
+            msg: str = (
+                f'PRIVATE_KEY and PUBLIC_KEY are required for {self.algorithm} tokens'
+            )
+            raise ValueError(msg)
+
+        private_key = load_pem_private_key(
+            base64.b64decode(settings.private_key), password=None
+        )
+        public_key = load_pem_public_key(base64.b64decode(settings.public_key))
+
+        return JwtKey(
+            kid=settings.token_key_id or _key_id(public_key),
+            public_key=public_key,
+            private_key=private_key,
+        )
+
+    def set_keys(
+        self,
+        default_key: JwtKey,
+        keys: dict[str, JwtKey],
+        signing_kid: str,
+        fingerprint: tuple[tuple[str, int], ...] = (),
+    ) -> None:
+        """Replace the current state with the given keys.
+
+        Args:
+            default_key: Key used to verify tokens without a `kid` header.
+            keys: All verification keys, by key id.
+            signing_kid: Key id of the key used for signing.
+            fingerprint: Key directory fingerprint the keys were loaded from.
+
+        Raises:
+            ValueError: If the signing key is unknown or has no private key.
+        """
+        signing_key = keys.get(signing_kid)
+
+        if signing_key is None or signing_key.private_key is None:
+            msg: str = f'No private key available for signing key id {signing_kid!r}'
+            raise ValueError(msg)
+
+        self._state = _KeyRingState(
+            default_key=default_key,
+            signing_key=signing_key,
+            verify_keys=keys,
+            fingerprint=fingerprint,
+        )
+
+    def load(self) -> None:
+        """Parse all configured keys and replace the current state.
+
+        Raises:
+            ValueError: If the key material for the configured algorithm is
+                missing, or if the signing key id is unknown or has no
+                private key.
+        """
+        fingerprint = self._fingerprint()
+        default_key = self._load_default_key()
+        keys: dict[str, JwtKey] = {default_key.kid: default_key}
+
+        if self._keys_dir is not None and self.algorithm not in SYMMETRIC_ALGORITHMS:
+            for name, _ in fingerprint:
+                key = _load_pem_file(self._keys_dir / name)
+                keys[key.kid] = key
+
+        signing_kid: str = settings.token_signing_key_id or default_key.kid
+        self.set_keys(default_key, keys, signing_kid, fingerprint)
+
+        logger.info(
+            'Loaded %s JWT key ring: signing with %s, %d verification key(s)',
+            self.algorithm,
+            signing_kid,
+            len(keys),
+        )
+
+    @classmethod
+    def from_keys(
+        cls,
+        algorithm: str,
+        keys: list[JwtKey],
+        signing_kid: str | None = None,
+    ) -> 'KeyRing':
+        """Build a static key ring from already parsed keys.
+
+        Useful for tooling and benchmarks that should not depend on the
+        key material of the current deployment.
+
+        Args:
+            algorithm: The JWT algorithm the keys are meant for.
+            keys: The keys to include. The first one is the default key.
+            signing_kid: Key id used for signing. Defaults to the first key.
+
+        Returns:
+            A loaded key ring that never reloads from disk.
+        """
+        ring = cls(algorithm, keys_dir=None)
+        ring.set_keys(
+            default_key=keys[0],
+            keys={key.kid: key for key in keys},
+            signing_kid=signing_kid or keys[0].kid,
+        )
+        return ring
+
+    def _get_state(self) -> _KeyRingState:
+        if self._state is None:
+            self.load()
+
+        return self._state  # type: ignore[return-value]
+
+    @property
+    def signing_key(self) -> JwtKey:
+        """The key used to sign newly issued tokens."""
+        return self._get_state().signing_key
+
+    def verify_key(self, kid: str | None) -> JwtKey:
+        """Select the verification key for a token.
+
+        Args:
+            kid: The `kid` header of the token. Tokens issued before key ids
+                were introduced carry none and are verified with the key
+                configured through `PUBLIC_KEY`.
+
+        Returns:
+            The matching verification key.
+
+        Raises:
+            TokenError: If the key id is not part of the key ring.
+        """
+        state = self._get_state()
+
+        if kid is None:
+            return state.default_key
+
+        key = state.verify_keys.get(kid)
+
+        if key is None:
+            msg: str = 'Unknown token signing key'
+            raise TokenError(msg)
+
+        return key
+
+    def reload_if_changed(self) -> bool:
+        """Reload the key ring when the key directory content changed.
+
+        Returns:
+            True if the keys were reloaded; otherwise, False.
+        """
+        if self._state is not None and self._fingerprint() == self._state.fingerprint:
+            return False
+
+        self.load()
+        return True
+
+    async def _watch(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+
+            try:
+                self.reload_if_changed()
+            except (OSError, ValueError):
+                logger.exception('Failed to reload JWT key ring, keeping old keys')
+
+    async def start(self) -> None:
+        """Load the keys and start watching the key directory for changes."""
+        self.load()
+
+        if self._keys_dir is not None and settings.token_keys_reload_interval > 0:
+            self._reload_task = asyncio.create_task(
+                self._watch(settings.token_keys_reload_interval),
+                name='jwt-keyring-reload',
+            )
+
+    async def stop(self) -> None:
+        """Stop watching the key directory."""
+        if self._reload_task is None:
+            return
+
+        self._reload_task.cancel()
+
+        with suppress(asyncio.CancelledError):
+            await self._reload_task
+
+        self._reload_task = None
+
+
+keyring = KeyRing(
+    settings.token_algorithm,
+    keys_dir=Path(settings.token_keys_dir) if settings.token_keys_dir else None,
+)
+on_startup(keyring.start)
+on_shutdown(keyring.stop)
+
+
+__all__ = [
+    'SYMMETRIC_ALGORITHMS',
+    'JwtKey',
+    'KeyRing',
+    'keyring',
+]
@@ -1,9 +1,58 @@
-from collections.abc import AsyncIterator
+import logging
+
+from collections.abc import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+)
 from contextlib import asynccontextmanager
 from time import perf_counter_ns
 
 from fastapi import FastAPI
 
+from app.configs import core_configs
+
+
+logger = logging.getLogger(core_configs.logger_name)
+
+type LifecycleHook = Callable[[], Awaitable[None]]
+
+_startup_hooks: list[LifecycleHook] = []
+_shutdown_hooks: list[LifecycleHook] = []
+
+
+def on_startup(hook: LifecycleHook) -> LifecycleHook:
+    """Register a coroutine function to run during application startup.
+
+    Hooks run in registration order. The function is returned unchanged so
+    this can be used as a decorator.
+
+    Args:
+        hook: A coroutine function taking no arguments.
+
+    Returns:
+        The registered hook.
+    """
+    _startup_hooks.append(hook)
+    return hook
+
+
+def on_shutdown(hook: LifecycleHook) -> LifecycleHook:
+    """Register a coroutine function to run during application shutdown.
+
+    Hooks run in reverse registration order. A failing hook is logged and
+    does not keep the remaining hooks from running. The function is
+    returned unchanged so this can be used as a decorator.
+
+    Args:
+        hook: A coroutine function taking no arguments.
+
+    Returns:
+        The registered hook.
+    """
+    _shutdown_hooks.append(hook)
+    return hook
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
@@ -11,7 +60,8 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
 
     This lifespan function records the application start time in nanoseconds
     and stores it on the FastAPI application state during startup. The value
-    is removed during application shutdown.
+    is removed during application shutdown. Hooks registered through
+    `on_startup` and `on_shutdown` run around the application lifetime.
 
     Args:
         app: The FastAPI application instance.
@@ -22,6 +72,15 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     start_time_ns: int = perf_counter_ns()
     app.state.start_time_ns = start_time_ns
 
+    for hook in _startup_hooks:
+        await hook()
+
     yield
 
+    for hook in reversed(_shutdown_hooks):
+        try:
+            await hook()
+        except Exception:
+            logger.exception('Shutdown hook %s failed', getattr(hook, '__qualname__', hook))
+
     del app.state.start_time_ns
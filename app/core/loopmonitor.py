@@ -0,0 +1,169 @@
+import asyncio
+import logging
+import sys
+import threading
+import traceback
+
+from contextlib import suppress
+from time import monotonic
+
+from app.configs import core_configs
+from app.core.lifespan import (
+    on_shutdown,
+    on_startup,
+)
+from app.core.metrics import Histogram
+from app.core.prometheus import (
+    MetricsSnapshot,
+    register_collector,
+)
+from app.core.request import get_task_request_id
+
+
+logger = logging.getLogger(core_configs.logger_name)
+
+
+class LoopLagMonitor:
+    """Measure event loop scheduling lag and attribute stalls to code.
+
+    A heartbeat task wakes up every `interval` seconds and records how late
+    it was scheduled into a histogram. A watchdog thread checks the time of
+    the last heartbeat; when the loop has not completed one for longer than
+    `interval` plus `threshold_ms`, the loop is blocked by the callback that
+    is currently running. Its stack is captured from the loop thread and
+    logged together with the request ID of the current task, once per stall.
+    """
+
+    def __init__(self, interval: float, threshold_ms: float) -> None:
+        """Initialize the monitor without starting it.
+
+        Args:
+            interval: Number of seconds between heartbeats.
+            threshold_ms: Lag in milliseconds from which a stall is reported.
+        """
+        self.interval = interval
+        self.threshold_ms = threshold_ms
+        self.lag_ms = Histogram()
+        self.stalls: int = 0
+
+        self._last_beat: float = monotonic()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread_id: int | None = None
+        self._task: asyncio.Task | None = None
+        self._thread: threading.Thread | None = None
+        self._stopped = threading.Event()
+
+    async def _heartbeat(self) -> None:
+        loop = asyncio.get_running_loop()
+
+        while True:
+            scheduled: float = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            self.lag_ms.observe(max(loop.time() - scheduled, 0.0) * 1_000)
+            self._last_beat = monotonic()
+
+    def _capture_stall(self, stalled_ms: float) -> None:
+        frame = sys._current_frames().get(self._loop_thread_id)  # type: ignore[arg-type] # noqa: SLF001
+        task = asyncio.current_task(self._loop)
+        request_id: str | None = get_task_request_id(task) if task is not None else None
+        stack: str = ''.join(traceback.format_stack(frame)) if frame is not None else 'n/a'
+
+        self.stalls += 1
+        logger.warning(
+            'Event loop blocked for %.1f milliseconds by task %s (request %s):\n%s',
+            stalled_ms,
+            task.get_name() if task is not None else None,
+            request_id,
+            stack,
+        )
+
+    def _watch(self) -> None:
+        poll_interval: float = max(self.threshold_ms / 2_000, 0.01)
+        reported_beat: float | None = None
+
+        while not self._stopped.wait(poll_interval):
+            last_beat: float = self._last_beat
+            stalled_ms: float = (monotonic() - last_beat - self.interval) * 1_000
+
+            if stalled_ms >= self.threshold_ms and reported_beat != last_beat:
+                reported_beat = last_beat
+                self._capture_stall(stalled_ms)
+
+    def stats(self) -> dict:
+        """Return the lag distribution and the number of reported stalls.
+
+        Returns:
+            A dictionary with the lag histogram snapshot in milliseconds,
+            the stall threshold and the number of stalls.
+        """
+        return {
+            'lag_ms': self.lag_ms.snapshot(),
+            'threshold_ms': self.threshold_ms,
+            'stalls': self.stalls,
+        }
+
+    def collect(self, snapshot: MetricsSnapshot) -> None:
+        """Add the lag histogram and the stall count to a snapshot.
+
+        Args:
+            snapshot: The snapshot to add the metrics to.
+        """
+        snapshot.histogram(
+            'event_loop_lag_seconds',
+            'Event loop scheduling lag.',
+            self.lag_ms,
+            0.001,
+        )
+        snapshot.counter(
+            'event_loop_stalls_total',
+            'Event loop stalls longer than the threshold.',
+            self.stalls,
+        )
+
+    async def start(self) -> None:
+        """Start the heartbeat task and the watchdog thread."""
+        if self._task is not None:
+            return
+
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = monotonic()
+        self._stopped.clear()
+
+        self._task = asyncio.create_task(self._heartbeat(), name='loop-lag-heartbeat')
+        self._thread = threading.Thread(target=self._watch, name='loop-lag-watchdog', daemon=True)
+        self._thread.start()
+
+    async def stop(self) -> None:
+        """Stop the heartbeat task and the watchdog thread."""
+        if self._task is None:
+            return
+
+        self._stopped.set()
+        self._task.cancel()
+
+        with suppress(asyncio.CancelledError):
+            await self._task
+
+        if self._thread is not None:
+            self._thread.join()
+
+        self._task = None
+        self._thread = None
+
+
+loop_monitor = LoopLagMonitor(
+    interval=core_configs.loop_monitor_interval,
+    threshold_ms=core_configs.loop_lag_threshold_ms,
+)
+
+if core_configs.loop_monitor_enabled:
+    on_startup(loop_monitor.start)
+    on_shutdown(loop_monitor.stop)
+    register_collector(loop_monitor.collect)
+
+
+__all__ = [
+    'LoopLagMonitor',
+    'loop_monitor',
+]
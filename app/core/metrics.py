@@ -0,0 +1,124 @@
+from bisect import bisect_left
+from collections.abc import Sequence
+from typing import Final
+
+
+DEFAULT_LATENCY_BUCKETS_MS: Final[tuple[float, ...]] = (
+    0.5,
+    1,
+    2.5,
+    5,
+    10,
+    25,
+    50,
+    100,
+    250,
+    500,
+    1_000,
+    2_500,
+    5_000,
+    10_000,
+)
+
+
+class Histogram:
+    """Fixed-bucket histogram for latency style measurements.
+
+    Observations are counted into cumulative-friendly buckets defined by
+    their upper bounds, which keeps `observe` constant-time and the memory
+    footprint independent of the number of observations. Quantiles are
+    approximated by the upper bound of the bucket that contains them.
+    """
+
+    __slots__ = ('_bounds', '_counts', 'count', 'max', 'sum')
+
+    def __init__(
+        self,
+        bounds: Sequence[float] = DEFAULT_LATENCY_BUCKETS_MS,
+    ) -> None:
+        """Initialize an empty histogram.
+
+        Args:
+            bounds: Sorted upper bounds of the buckets. An implicit `+Inf`
+                bucket is always appended.
+        """
+        self._bounds: tuple[float, ...] = tuple(bounds)
+        self._counts: list[int] = [0] * (len(self._bounds) + 1)
+        self.count: int = 0
+        self.sum: float = 0.0
+        self.max: float = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record a single observation.
+
+        Args:
+            value: The observed value, in the unit of the bucket bounds.
+        """
+        self._counts[bisect_left(self._bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> float:
+        """Approximate the given quantile from the bucket counts.
+
+        Args:
+            q: The quantile to compute, between 0 and 1.
+
+        Returns:
+            The upper bound of the bucket containing the quantile, or the
+            largest observed value when it falls into the `+Inf` bucket.
+        """
+        if not self.count:
+            return 0.0
+
+        rank: float = q * self.count
+        seen: int = 0
+
+        for bound, bucket_count in zip(self._bounds, self._counts, strict=False):
+            seen += bucket_count
+            if seen >= rank:
+                return min(bound, self.max)
+
+        return self.max
+
+    def buckets(self) -> list[tuple[float, int]]:
+        """Return the cumulative bucket counts.
+
+        Returns:
+            A list of `(upper_bound, cumulative_count)` pairs, ending with the
+            `+Inf` bucket.
+        """
+        cumulative: list[tuple[float, int]] = []
+        seen: int = 0
+
+        for bound, bucket_count in zip(
+            (*self._bounds, float('inf')), self._counts, strict=True
+        ):
+            seen += bucket_count
+            cumulative.append((bound, seen))
+
+        return cumulative
+
+    def snapshot(self) -> dict:
+        """Summarize the histogram as a JSON serializable dictionary.
+
+        Returns:
+            A dictionary with the observation count, mean, p50, p95, p99 and
+            maximum values.
+        """
+        return {
+            'count': self.count,
+            'mean': round(self.sum / self.count, 4) if self.count else 0.0,
+            'p50': round(self.quantile(0.50), 4),
+            'p95': round(self.quantile(0.95), 4),
+            'p99': round(self.quantile(0.99), 4),
+            'max': round(self.max, 4),
+        }
+
+
+__all__ = [
+    'DEFAULT_LATENCY_BUCKETS_MS',
+    'Histogram',
+]
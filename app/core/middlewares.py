@@ -1,24 +1,33 @@
 import logging
+import re
 
-from collections.abc import (
-    Awaitable,
-    Callable,
-)
 from time import perf_counter_ns
-from typing import TYPE_CHECKING
+from typing import (
+    TYPE_CHECKING,
+    Final,
+)
 from uuid import uuid4
 
-from fastapi import (
-    Request,
-    Response,
+from starlette.datastructures import MutableHeaders
+from starlette.types import (
+    ASGIApp,
+    Message,
+    Receive,
+    Scope,
+    Send,
 )
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
 
 from app.configs import core_configs
+from app.core.prometheus import (
+    UNMATCHED_ROUTE,
+    request_metrics,
+)
 from app.core.request import (
     remove_request_id,
+    run_request_end_hooks,
     set_request_id,
+    start_db_stats,
+    stop_db_stats,
 )
 
 
@@ -28,53 +37,155 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(core_configs.logger_name)
 
+REQUEST_ID_HEADER: Final[bytes] = core_configs.request_id_header.lower().encode()
+_VALID_REQUEST_ID: Final[re.Pattern[bytes]] = re.compile(rb'^[\w.:-]{1,128}$')
 
-class AddRequestIdMiddleware(BaseHTTPMiddleware):
-    """Middleware that assigns and manages a unique request ID per request.
 
-    This middleware generates a unique request ID for each incoming HTTP
-    request, stores it in the request state, and sets it in a context variable
-    for use throughout the request lifecycle (e.g., logging and tracing).
-    It also measures and logs the total request processing time.
+def _incoming_request_id(scope: Scope) -> str | None:
+    """Return a well-formed request ID sent by an upstream proxy, if any.
+
+    Args:
+        scope: The ASGI connection scope.
+
+    Returns:
+        The incoming request ID, or None when the header is absent or does
+        not look like an identifier.
+    """
+    for name, value in scope['headers']:
+        if name == REQUEST_ID_HEADER:
+            return value.decode() if _VALID_REQUEST_ID.match(value) else None
+
+    return None
+
+
+_route_templates: dict[int, str] = {}
+
+
+def _route_template(scope: Scope) -> str:
+    """Return the full path template of the route that handled a request.
+
+    Depending on the FastAPI version, `scope['route'].path` is either the
+    full template or relative to the router that was included, without the
+    include prefixes. The prefix is recovered once per route from the
+    concrete request path and memoized by route identity, as routes live as
+    long as the application.
+
+    Args:
+        scope: The ASGI connection scope after routing.
 
-    The request ID is automatically removed from the context after the
-    response is generated to prevent context leakage across requests.
+    Returns:
+        The path template, or `UNMATCHED_ROUTE` when no route matched.
+    """
+    route = scope.get('route')
+
+    if route is None:
+        return UNMATCHED_ROUTE
+
+    template = _route_templates.get(id(route))
+
+    if template is None:
+        path: str = scope['path']
+        prefix_end: int = next(
+            (
+                index
+                for index, char in enumerate(path)
+                if char == '/' and route.path_regex.match(path[index:])
+            ),
+            0,
+        )
+        template = _route_templates[id(route)] = path[:prefix_end] + route.path
+
+    return template
+
+
+class AddRequestIdMiddleware:
+    """Middleware that assigns and manages a unique request ID per request.
+
+    This middleware reuses the request ID sent by an upstream proxy or
+    generates a new one, stores it in the request state, and sets it in a
+    context variable for use throughout the request lifecycle (e.g., logging
+    and tracing). The ID is echoed in the response headers and the total
+    request processing time is logged once the response has been sent.
+
+    Database statements executed while handling the request are collected
+    into request-scoped statistics, reported in a `Server-Timing` response
+    header and in the final log line. Request counts, latencies and database
+    time are recorded per route template for the metrics endpoint. Hooks
+    registered with `on_request_end` run once the response has been sent,
+    e.g. to release request-scoped resources.
+
+    It is implemented as a plain ASGI middleware, so the response body is
+    passed through untouched and streaming responses are not buffered. The
+    request ID is removed from the context after the response is generated
+    to prevent context leakage across requests.
     """
 
     def __init__(  # noqa: D107
         self,
         app: ASGIApp,
     ) -> None:
-        super().__init__(app)
+        self.app = app
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: Callable[[Request], Awaitable[Response]],
-    ) -> Response:
-        """Process an incoming HTTP request and attach a request ID.
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Process an incoming ASGI connection and attach a request ID.
 
         Args:
-            request: The incoming HTTP request.
-            call_next: A callable that forwards the request to the next
-                middleware or route handler.
-
-        Returns:
-            The HTTP response returned by the downstream application.
+            scope: The ASGI connection scope.
+            receive: The ASGI receive channel.
+            send: The ASGI send channel.
         """
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
         start_time_ns = perf_counter_ns()
-        request_id: str = str(uuid4().hex)
-        request.state.request_id = request_id
+        request_id: str = _incoming_request_id(scope) or uuid4().hex
+        scope.setdefault('state', {})['request_id'] = request_id
         ctx_token: Token = await set_request_id(request_id)
-        logger.info(f'Start processing request: {request_id}')
-
-        response = await call_next(request)
-
-        await remove_request_id(ctx_token)
-        duration_ns: int = perf_counter_ns() - start_time_ns
-        duration_ms: float = duration_ns / 1_000_000
-        logger.info(
-            f'Finished processing request: {request_id} in {duration_ms:.4f} milliseconds'
-        )
-
-        return response
+        db_stats, db_stats_token = start_db_stats()
+        status_code: int = 500
+        request_metrics.in_flight += 1
+
+        async def send_with_request_id(message: Message) -> None:
+            nonlocal status_code
+
+            if message['type'] == 'http.response.start':
+                status_code = message['status']
+                app_duration_ms: float = (perf_counter_ns() - start_time_ns) / 1_000_000
+                headers = MutableHeaders(scope=message)
+                headers.append(core_configs.request_id_header, request_id)
+                headers.append(
+                    'Server-Timing',
+                    f'{db_stats.server_timing()}, app;dur={app_duration_ms:.3f}',
+                )
+
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            await run_request_end_hooks(request_id)
+            stop_db_stats(db_stats_token)
+            await remove_request_id(ctx_token)
+            duration_ms: float = (perf_counter_ns() - start_time_ns) / 1_000_000
+            request_metrics.in_flight -= 1
+            request_metrics.observe(
+                scope['method'],
+                _route_template(scope),
+                status_code,
+                duration_ms,
+                db_stats.total_ns / 1_000_000,
+            )
+            logger.info(
+                'Finished processing request: %s %s %s %d in %.4f milliseconds '
+                '(db: %d queries, %.4f milliseconds, %d rows, slowest %.4f milliseconds)',
+                request_id,
+                scope['method'],
+                scope['path'],
+                status_code,
+                duration_ms,
+                db_stats.statements,
+                db_stats.total_ns / 1_000_000,
+                db_stats.rows,
+                db_stats.slowest_ns / 1_000_000,
+            )
@@ -0,0 +1,495 @@
+import asyncio
+import json
+import logging
+import os
+
+from collections.abc import Callable
+from contextlib import suppress
+from pathlib import Path
+from typing import (
+    Final,
+    Literal,
+)
+
+import psutil
+
+from app.configs import core_configs
+from app.core.lifespan import (
+    on_shutdown,
+    on_startup,
+)
+from app.core.metrics import Histogram
+
+
+logger = logging.getLogger(core_configs.logger_name)
+
+CONTENT_TYPE: Final[str] = 'text/plain; version=0.0.4; charset=utf-8'
+UNMATCHED_ROUTE: Final[str] = '<unmatched>'
+
+type MetricType = Literal['counter', 'gauge', 'histogram']
+type Collector = Callable[['MetricsSnapshot'], None]
+
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+def _format_labels(labels: dict[str, object]) -> str:
+    return ','.join(
+        '{}="{}"'.format(
+            name,
+            str(value).replace('\\', r'\\').replace('\n', r'\n').replace('"', r'\"'),
+        )
+        for name, value in labels.items()
+    )
+
+
+def _series(name: str, labels: str) -> str:
+    return f'{name}{{{labels}}}' if labels else name
+
+
+class MetricsSnapshot:
+    """A point-in-time set of metric families in a JSON serializable form.
+
+    Samples are keyed by their formatted label set, so snapshots taken by
+    different worker processes can be merged by plain addition. Histograms
+    keep their cumulative bucket counts for the same reason.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty snapshot."""
+        self.families: dict[str, dict] = {}
+
+    def _family(self, name: str, metric_type: MetricType, documentation: str) -> dict:
+        family = self.families.get(name)
+
+        if family is None:
+            family = self.families[name] = {
+                'type': metric_type,
+                'help': documentation,
+                'samples': {},
+            }
+
+        return family
+
+    def counter(self, name: str, documentation: str, value: float, **labels: object) -> None:
+        """Add a counter sample.
+
+        Args:
+            name: The metric name, including the `_total` suffix.
+            documentation: The HELP text of the metric.
+            value: The counter value.
+            **labels: The sample labels.
+        """
+        samples = self._family(name, 'counter', documentation)['samples']
+        key: str = _format_labels(labels)
+        samples[key] = samples.get(key, 0) + value
+
+    def gauge(self, name: str, documentation: str, value: float, **labels: object) -> None:
+        """Add a gauge sample.
+
+        Args:
+            name: The metric name.
+            documentation: The HELP text of the metric.
+            value: The current value.
+            **labels: The sample labels.
+        """
+        samples = self._family(name, 'gauge', documentation)['samples']
+        key: str = _format_labels(labels)
+        samples[key] = samples.get(key, 0) + value
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        histogram: Histogram,
+        scale: float = 1.0,
+        **labels: object,
+    ) -> None:
+        """Add a histogram sample.
+
+        Args:
+            name: The metric name.
+            documentation: The HELP text of the metric.
+            histogram: The histogram to export.
+            scale: Factor converting the histogram unit to the exported unit,
+                e.g. `0.001` to export milliseconds as seconds.
+            **labels: The sample labels.
+        """
+        samples = self._family(name, 'histogram', documentation)['samples']
+        self._add_histogram(
+            samples,
+            _format_labels(labels),
+            {
+                'buckets': [
+                    [_format_value(bound * scale), count]
+                    for bound, count in histogram.buckets()
+                ],
+                'sum': histogram.sum * scale,
+                'count': histogram.count,
+            },
+        )
+
+    @staticmethod
+    def _add_histogram(samples: dict, key: str, sample: dict) -> None:
+        current = samples.get(key)
+
+        if current is None:
+            samples[key] = {**sample, 'buckets': [list(bucket) for bucket in sample['buckets']]}
+            return
+
+        for bucket, (_, count) in zip(current['buckets'], sample['buckets'], strict=True):
+            bucket[1] += count
+
+        current['sum'] += sample['sum']
+        current['count'] += sample['count']
+
+    def merge(self, families: dict[str, dict], *, include_gauges: bool = True) -> None:
+        """Add the families of another snapshot to this one.
+
+        Args:
+            families: The `families` of the snapshot to merge.
+            include_gauges: Whether gauges are merged. Gauges describe live
+                state and are skipped for processes that no longer run.
+        """
+        for name, family in families.items():
+            if family['type'] == 'gauge' and not include_gauges:
+                continue
+
+            samples = self._family(name, family['type'], family['help'])['samples']
+
+            for key, sample in family['samples'].items():
+                if family['type'] == 'histogram':
+                    self._add_histogram(samples, key, sample)
+                else:
+                    samples[key] = samples.get(key, 0) + sample
+
+    def render(self) -> str:
+        """Render the snapshot in the Prometheus text exposition format.
+
+        Returns:
+            The exposition text.
+        """
+        lines: list[str] = []
+
+        for name, family in sorted(self.families.items()):
+            lines.append(f'# HELP {name} {family["help"]}')
+            lines.append(f'# TYPE {name} {family["type"]}')
+
+            for key, sample in family['samples'].items():
+                if family['type'] != 'histogram':
+                    lines.append(f'{_series(name, key)} {_format_value(sample)}')
+                    continue
+
+                separator: str = ',' if key else ''
+
+                for bound, count in sample['buckets']:
+                    lines.append(f'{name}_bucket{{{key}{separator}le="{bound}"}} {count}')
+
+                lines.append(f'{_series(name + "_sum", key)} {_format_value(sample["sum"])}')
+                lines.append(f'{_series(name + "_count", key)} {sample["count"]}')
+
+        return '\n'.join(lines) + '\n'
+
+
+class RouteMetrics:
+    """Request counters and histograms of one route and status code."""
+
+    __slots__ = ('count', 'db_time_ms', 'duration_ms')
+
+    def __init__(self) -> None:
+        """Initialize empty metrics."""
+        self.count: int = 0
+        self.duration_ms = Histogram()
+        self.db_time_ms = Histogram()
+
+
+class RequestMetrics:
+    """Per-process HTTP request metrics.
+
+    Requests are recorded from the event loop thread only, so plain
+    attribute updates are safe without locking. Routes are labeled with
+    their path template, which keeps the label cardinality bounded.
+    """
+
+    __slots__ = ('_routes', 'in_flight')
+
+    def __init__(self) -> None:
+        """Initialize empty metrics."""
+        self.in_flight: int = 0
+        self._routes: dict[tuple[str, str, int], RouteMetrics] = {}
+
+    def observe(
+        self,
+        method: str,
+        route: str,
+        status: int,
+        duration_ms: float,
+        db_time_ms: float,
+    ) -> None:
+        """Record one finished request.
+
+        Args:
+            method: The HTTP method.
+            route: The path template of the matched route.
+            status: The response status code.
+            duration_ms: Total request duration in milliseconds.
+            db_time_ms: Time spent executing statements in milliseconds.
+        """
+        key = (method, route, status)
+        metrics = self._routes.get(key)
+
+        if metrics is None:
+            metrics = self._routes[key] = RouteMetrics()
+
+        metrics.count += 1
+        metrics.duration_ms.observe(duration_ms)
+        metrics.db_time_ms.observe(db_time_ms)
+
+    def collect(self, snapshot: MetricsSnapshot) -> None:
+        """Add the request metrics to a snapshot.
+
+        Args:
+            snapshot: The snapshot to add the metrics to.
+        """
+        snapshot.gauge(
+            'http_requests_in_flight',
+            'Requests currently being processed.',
+            self.in_flight,
+        )
+
+        for (method, route, status), metrics in list(self._routes.items()):
+            snapshot.counter(
+                'http_requests_total',
+                'Processed HTTP requests.',
+                metrics.count,
+                method=method,
+                route=route,
+                status=status,
+            )
+            snapshot.histogram(
+                'http_request_duration_seconds',
+                'HTTP request duration.',
+                metrics.duration_ms,
+                0.001,
+                method=method,
+                route=route,
+                status=status,
+            )
+            snapshot.histogram(
+                'http_request_db_duration_seconds',
+                'Time spent executing SQL statements per HTTP request.',
+                metrics.db_time_ms,
+                0.001,
+                method=method,
+                route=route,
+                status=status,
+            )
+
+
+request_metrics = RequestMetrics()
+_collectors: list[Collector] = [request_metrics.collect]
+
+
+def register_collector(collector: Collector) -> Collector:
+    """Register a function adding metrics to every snapshot.
+
+    The function is returned unchanged so this can be used as a decorator.
+
+    Args:
+        collector: A function receiving the snapshot to add metrics to.
+
+    Returns:
+        The registered collector.
+    """
+    _collectors.append(collector)
+    return collector
+
+
+def collect_local() -> MetricsSnapshot:
+    """Take a snapshot of the metrics of the current process.
+
+    Returns:
+        The snapshot with the metrics of every registered collector.
+    """
+    snapshot = MetricsSnapshot()
+
+    for collector in _collectors:
+        collector(snapshot)
+
+    return snapshot
+
+
+class MetricsExporter:
+    """Share metrics between the worker processes of one server.
+
+    Without a directory, only the metrics of the current process are
+    exported. With a directory, every worker periodically writes its
+    snapshot to `metrics-<pid>.json` in it, and a scrape of any worker
+    merges all files. Counters and histograms of exited workers are kept so
+    totals never go backwards; their gauges are dropped.
+
+    Workers of one server are told apart from those of earlier runs by
+    the PID and start time of their parent, the process manager. Files of
+    other servers are removed when a worker starts and ignored when
+    merging, as is a file left behind under the PID of the worker itself.
+    A server without a process manager has nothing to share and should
+    not set a directory.
+    """
+
+    def __init__(self, directory: Path | None, interval: float) -> None:
+        """Initialize the exporter without starting the background task.
+
+        Args:
+            directory: Directory shared by all workers, if any.
+            interval: Number of seconds between snapshot writes.
+        """
+        self.directory = directory
+        self.interval = interval
+        self.server_id: str = self._server_id()
+        self._task: asyncio.Task | None = None
+
+    @staticmethod
+    def _server_id() -> str:
+        parent_pid: int = os.getppid()
+
+        try:
+            started_at: float = psutil.Process(parent_pid).create_time()
+        except psutil.Error:
+            started_at = 0.0
+
+        return f'{parent_pid}-{started_at}'
+
+    def _path(self, pid: int) -> Path:
+        return self.directory / f'metrics-{pid}.json'  # type: ignore[operator]
+
+    def write(self, snapshot: MetricsSnapshot) -> None:
+        """Atomically write the snapshot of the current process.
+
+        Args:
+            snapshot: The snapshot to write.
+        """
+        pid: int = os.getpid()
+        path: Path = self._path(pid)
+        temporary_path: Path = path.with_suffix('.tmp')
+        temporary_path.write_text(
+            json.dumps({'pid': pid, 'server': self.server_id, 'families': snapshot.families})
+        )
+        temporary_path.replace(path)
+
+    def aggregate(self, snapshot: MetricsSnapshot) -> MetricsSnapshot:
+        """Merge the snapshots of all workers.
+
+        Blocking file IO; call it from a worker thread.
+
+        Args:
+            snapshot: A fresh snapshot of the current process.
+
+        Returns:
+            The merged snapshot.
+        """
+        if self.directory is None:
+            return snapshot
+
+        self.write(snapshot)
+        merged = MetricsSnapshot()
+
+        for path in sorted(self.directory.glob('metrics-*.json')):
+            try:
+                data: dict = json.loads(path.read_text())
+            except (OSError, ValueError):
+                logger.warning('Skipping unreadable metrics file %s', path)
+                continue
+
+            if data.get('server') != self.server_id:
+                continue
+
+            merged.merge(data['families'], include_gauges=psutil.pid_exists(data['pid']))
+
+        return merged
+
+    async def render(self) -> str:
+        """Render the metrics of this server in the exposition format.
+
+        Returns:
+            The exposition text.
+        """
+        snapshot: MetricsSnapshot = collect_local()
+
+        if self.directory is None:
+            return snapshot.render()
+
+        merged = await asyncio.to_thread(self.aggregate, snapshot)
+        return merged.render()
+
+    def prune(self) -> None:
+        """Remove the files of earlier servers and of this worker's PID.
+
+        Blocking file IO; call it from a worker thread.
+        """
+        own_path: Path = self._path(os.getpid())
+
+        for path in self.directory.glob('metrics-*.json'):  # type: ignore[union-attr]
+            try:
+                stale: bool = (
+                    path == own_path
+                    or json.loads(path.read_text()).get('server') != self.server_id
+                )
+            except (OSError, ValueError):
+                stale = True
+
+            if stale:
+                logger.info('Removing stale metrics file %s', path)
+                path.unlink(missing_ok=True)
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+
+            try:
+                await asyncio.to_thread(self.write, collect_local())
+            except OSError:
+                logger.exception('Failed to write metrics snapshot')
+
+    async def start(self) -> None:
+        """Start writing snapshots when a directory is configured."""
+        if self.directory is not None and self._task is None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            await asyncio.to_thread(self.prune)
+            self._task = asyncio.create_task(self._run(), name='metrics-exporter')
+
+    async def stop(self) -> None:
+        """Stop writing snapshots and write a final one."""
+        if self._task is None:
+            return
+
+        self._task.cancel()
+
+        with suppress(asyncio.CancelledError):
+            await self._task
+
+        self._task = None
+        self.write(collect_local())
+
+
+metrics_exporter = MetricsExporter(
+    directory=Path(core_configs.metrics_dir) if core_configs.metrics_dir else None,
+    interval=core_configs.metrics_flush_interval,
+)
+on_startup(metrics_exporter.start)
+on_shutdown(metrics_exporter.stop)
+
+
+__all__ = [
+    'CONTENT_TYPE',
+    'UNMATCHED_ROUTE',
+    'MetricsExporter',
+    'MetricsSnapshot',
+    'collect_local',
+    'metrics_exporter',
+    'register_collector',
+    'request_metrics',
+]
@@ -0,0 +1,58 @@
+from time import monotonic
+
+
+class TokenBucket:
+    """Token bucket rate limiter for a single process.
+
+    The bucket holds up to `capacity` tokens and refills at `rate` tokens per
+    second. Each admitted call takes one token, so bursts of up to `capacity`
+    calls are allowed while the sustained rate is capped at `rate`.
+    """
+
+    __slots__ = ('_tokens', '_updated_at', 'capacity', 'rate', 'rejected')
+
+    def __init__(self, rate: float, capacity: int) -> None:
+        """Initialize a full bucket.
+
+        Args:
+            rate: Number of tokens added per second.
+            capacity: Maximum number of tokens in the bucket.
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.rejected: int = 0
+
+        self._tokens: float = float(capacity)
+        self._updated_at: float = monotonic()
+
+    def _refill(self) -> None:
+        now: float = monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    def try_acquire(self) -> bool:
+        """Take a token if one is available.
+
+        Returns:
+            True if the call is admitted; otherwise, False.
+        """
+        self._refill()
+
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return True
+
+        self.rejected += 1
+        return False
+
+    def retry_after(self) -> float:
+        """Return how long to wait until the next token is available.
+
+        Returns:
+            The number of seconds until a call would be admitted.
+        """
+        self._refill()
+        return max(0.0, (1 - self._tokens) / self.rate)
+
+
+__all__ = ['TokenBucket']
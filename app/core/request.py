@@ -1,9 +1,18 @@
+import asyncio
 import logging
 
+from collections.abc import (
+    Awaitable,
+    Callable,
+)
 from contextvars import (
     ContextVar,
     Token,
 )
+from dataclasses import (
+    dataclass,
+    field,
+)
 from typing import Final
 
 from app.configs import core_configs
@@ -18,6 +27,72 @@ _request_id_ctx_var: ContextVar[str | None] = ContextVar(
 )
 
 
+@dataclass(slots=True)
+class RequestDbStats:
+    """Database statistics collected while handling a single request.
+
+    Attributes:
+        statements: Number of executed SQL statements.
+        total_ns: Total time spent executing statements, in nanoseconds.
+        last_ns: Duration of the most recent statement, in nanoseconds.
+        slowest_ns: Duration of the slowest statement, in nanoseconds.
+        slowest_statement: SQL text of the slowest statement.
+        rows: Number of rows returned or affected, where reported.
+        fingerprint_counts: Executions per statement fingerprint, only
+            populated when repeated query detection is enabled.
+        primary_pinned: Whether the request wrote to the primary, in which
+            case later reads skip the read replicas.
+    """
+
+    statements: int = 0
+    total_ns: int = 0
+    last_ns: int = 0
+    slowest_ns: int = 0
+    slowest_statement: str | None = None
+    rows: int = 0
+    fingerprint_counts: dict[str, int] = field(default_factory=dict)
+    primary_pinned: bool = False
+
+    def record(self, statement: str, duration_ns: int, rowcount: int) -> None:
+        """Account for one executed statement.
+
+        Args:
+            statement: The executed SQL statement.
+            duration_ns: Execution time in nanoseconds.
+            rowcount: Rows returned or affected, negative when unknown.
+        """
+        self.statements += 1
+        self.total_ns += duration_ns
+        self.last_ns = duration_ns
+
+        if rowcount > 0:
+            self.rows += rowcount
+
+        if duration_ns > self.slowest_ns:
+            self.slowest_ns = duration_ns
+            self.slowest_statement = statement
+
+    def server_timing(self) -> str:
+        """Format the statistics as a `Server-Timing` header value.
+
+        Returns:
+            The header value with the total and slowest statement durations.
+        """
+        return (
+            f'db;dur={self.total_ns / 1_000_000:.3f};desc="{self.statements} queries", '
+            f'db-slowest;dur={self.slowest_ns / 1_000_000:.3f}'
+        )
+
+
+_db_stats_ctx_var: ContextVar[RequestDbStats | None] = ContextVar(
+    'request_db_stats', default=None
+)
+
+type RequestEndHook = Callable[[str], Awaitable[None]]
+
+_request_end_hooks: list[RequestEndHook] = []
+
+
 async def set_request_id(request_id: str) -> Token:
     """Set the request ID in the context for the current execution flow.
 
@@ -33,7 +108,7 @@ async def set_request_id(request_id: str) -> Token:
         A context variable token that can be used to restore the previous
         request ID value.
     """
-    logger.info(f'Session context initialized for request handling: {request_id}')
+    logger.debug('Session context initialized for request handling: %s', request_id)
     return _request_id_ctx_var.set(request_id)
 
 
@@ -46,6 +121,22 @@ def get_request_id() -> str | None:
     return _request_id_ctx_var.get()
 
 
+def get_task_request_id(task: asyncio.Task) -> str | None:
+    """Retrieve the request ID from the context of another task.
+
+    Unlike `get_request_id`, this can be called from outside the task, e.g.
+    from a monitoring thread inspecting the task currently running on the
+    event loop.
+
+    Args:
+        task: The task whose context should be read.
+
+    Returns:
+        The request ID set in the task context, or None.
+    """
+    return task.get_context().get(_request_id_ctx_var)
+
+
 async def remove_request_id(token: Token) -> None:
     """Remove the request ID from the context and restore the previous value.
 
@@ -62,6 +153,67 @@ async def remove_request_id(token: Token) -> None:
     _request_id_ctx_var.reset(token)
 
 
+def start_db_stats() -> tuple[RequestDbStats, Token]:
+    """Attach a fresh database statistics collector to the current context.
+
+    Returns:
+        The new collector and a context variable token to detach it with
+        `stop_db_stats`.
+    """
+    stats = RequestDbStats()
+    return stats, _db_stats_ctx_var.set(stats)
+
+
+def get_db_stats() -> RequestDbStats | None:
+    """Retrieve the database statistics collector of the current request.
+
+    Returns:
+        The collector if one is attached to the context; otherwise, None.
+    """
+    return _db_stats_ctx_var.get()
+
+
+def stop_db_stats(token: Token) -> None:
+    """Detach the collector attached by `start_db_stats`.
+
+    Args:
+        token: The context variable token returned by `start_db_stats`.
+    """
+    _db_stats_ctx_var.reset(token)
+
+
+def on_request_end(hook: RequestEndHook) -> RequestEndHook:
+    """Register a coroutine function to run once a request has finished.
+
+    Hooks run after the response has been sent, in registration order, while
+    the request ID is still set in the context. The function is returned
+    unchanged so this can be used as a decorator.
+
+    Args:
+        hook: A coroutine function taking the request ID.
+
+    Returns:
+        The registered hook.
+    """
+    _request_end_hooks.append(hook)
+    return hook
+
+
+async def run_request_end_hooks(request_id: str) -> None:
+    """Run the hooks registered through `on_request_end`.
+
+    A failing hook is logged and does not prevent the others from running.
+
+    Args:
+        request_id: The ID of the request that finished.
+    """
+    for hook in _request_end_hooks:
+        try:
+            await hook(request_id)
+        except Exception:
+            logger.exception('Request end hook %s failed for request %s', hook, request_id)
+
+
 # def default_fields(default_fields: dict[UserType, list] | list[str]):
 #     def decorator(func: Callable):
 #         @wraps(func)
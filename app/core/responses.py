@@ -0,0 +1,70 @@
+from typing import Any
+
+from pydantic import BaseModel
+from pydantic_core import to_json
+from starlette.background import BackgroundTask
+from starlette.responses import JSONResponse
+
+
+class ModelJSONResponse(JSONResponse):
+    """JSON response serializing pydantic models straight to bytes.
+
+    A model is encoded in one pass by its compiled pydantic-core serializer,
+    without building an intermediate dictionary for the stdlib `json`
+    encoder; `None` fields are omitted unless `exclude_none` is False.
+    Other content, such as plain dictionaries returned by endpoints, is
+    encoded with `pydantic_core`. Values that are not JSON serializable,
+    like exceptions in validation error contexts, are rendered with `str`.
+
+    When a model with a `status` field (e.g. `ResponseModel`) is given, it
+    is used as the default status code.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        content: Any,  # noqa: ANN401
+        status_code: int | None = None,
+        headers: dict[str, str] | None = None,
+        media_type: str | None = None,
+        background: BackgroundTask | None = None,
+        *,
+        exclude_none: bool = True,
+    ) -> None:
+        """Initialize the response.
+
+        Args:
+            content: The model or JSON compatible content to send.
+            status_code: The response status code. Defaults to the `status`
+                field of the model, or 200.
+            headers: Additional response headers.
+            media_type: The response media type.
+            background: A task to run after the response has been sent.
+            exclude_none: Whether `None` fields of a model are omitted.
+        """
+        self.exclude_none = exclude_none
+
+        if status_code is None:
+            status_code = getattr(content, 'status', 200)
+
+        super().__init__(content, status_code, headers, media_type, background)
+
+    def render(self, content: Any) -> bytes:  # noqa: ANN401
+        """Serialize the content to JSON.
+
+        Args:
+            content: The model or JSON compatible content to send.
+
+        Returns:
+            The encoded response body.
+        """
+        if isinstance(content, BaseModel):
+            return content.__pydantic_serializer__.to_json(
+                content,
+                exclude_none=self.exclude_none,
+                fallback=str,
+            )
+
+        return to_json(content, fallback=str)
+
+
+__all__ = ['ModelJSONResponse']
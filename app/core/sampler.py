@@ -0,0 +1,167 @@
+import asyncio
+import logging
+
+from collections import deque
+from contextlib import suppress
+from time import monotonic
+
+import psutil
+
+from app.configs import core_configs
+from app.core.lifespan import (
+    on_shutdown,
+    on_startup,
+)
+from app.schemas.core import (
+    SystemMetrics,
+    SystemSample,
+)
+
+
+logger = logging.getLogger(core_configs.logger_name)
+
+
+class SystemSampler:
+    """Periodically sample system and process resource usage.
+
+    A background task records one `SystemSample` every `interval` seconds
+    into a ring buffer of the last `window` samples. Readers only format the
+    buffered samples, so serving the metrics costs no system calls.
+
+    The event loop lag is how much later than scheduled the sampler wakes up,
+    which grows when the loop is blocked by synchronous work.
+    """
+
+    def __init__(self, interval: float, window: int) -> None:
+        """Initialize the sampler without starting the background task.
+
+        Args:
+            interval: Number of seconds between samples.
+            window: Number of samples kept for averaging.
+        """
+        self.interval = interval
+        self._samples: deque[tuple[float, SystemSample]] = deque(maxlen=window)
+        self._process = psutil.Process()
+        self._task: asyncio.Task | None = None
+
+    def _open_fds(self) -> int:
+        if hasattr(self._process, 'num_fds'):
+            return self._process.num_fds()
+
+        return self._process.num_handles()  # type: ignore[attr-defined]
+
+    def sample(self, loop_lag_ms: float = 0.0) -> SystemSample:
+        """Take one sample and append it to the ring buffer.
+
+        CPU percentages are measured since the previous sample, so the very
+        first call only primes the counters.
+
+        Args:
+            loop_lag_ms: The event loop lag measured by the caller.
+
+        Returns:
+            The new sample.
+        """
+        with self._process.oneshot():
+            sample: SystemSample = {
+                'cpu_percent': psutil.cpu_percent(),
+                'memory_percent': psutil.virtual_memory().percent,
+                'process_cpu_percent': self._process.cpu_percent(),
+                'process_rss_mb': round(self._process.memory_info().rss / 1_048_576, 2),
+                'open_fds': self._open_fds(),
+                'threads': self._process.num_threads(),
+                'loop_lag_ms': round(loop_lag_ms, 3),
+            }
+
+        self._samples.append((monotonic(), sample))
+        return sample
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+
+        while True:
+            scheduled: float = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            loop_lag_ms: float = max(loop.time() - scheduled, 0.0) * 1_000
+
+            try:
+                self.sample(loop_lag_ms)
+            except psutil.Error:
+                logger.exception('Failed to sample system metrics')
+
+    def latest(self) -> SystemSample | None:
+        """Return the most recent sample.
+
+        Returns:
+            The latest sample, or None before the first one was taken.
+        """
+        return self._samples[-1][1] if self._samples else None
+
+    def averages(self) -> SystemSample | None:
+        """Average every metric over the buffered samples.
+
+        Returns:
+            The averaged sample, or None before the first one was taken.
+        """
+        if not self._samples:
+            return None
+
+        count: int = len(self._samples)
+        samples: list[SystemSample] = [sample for _, sample in self._samples]
+
+        return {
+            key: round(sum(sample[key] for sample in samples) / count, 3)  # type: ignore[literal-required]
+            for key in samples[0]
+        }  # type: ignore[return-value]
+
+    def metrics(self) -> SystemMetrics:
+        """Summarize the buffered samples for the health payload.
+
+        Returns:
+            The latest sample, the window averages and the legacy
+            `cpu_usage`/`memory_usage` strings of the latest sample.
+        """
+        latest = self.latest()
+        now: float = monotonic()
+
+        return {
+            'cpu_usage': f'{latest["cpu_percent"]}%' if latest else 'n/a',
+            'memory_usage': f'{latest["memory_percent"]}%' if latest else 'n/a',
+            'sample_age_s': round(now - self._samples[-1][0], 3) if self._samples else None,
+            'latest': latest,
+            'averages': self.averages(),
+            'window_s': round(self._samples[-1][0] - self._samples[0][0], 3) if self._samples else 0.0,
+        }
+
+    async def start(self) -> None:
+        """Prime the CPU counters and start the sampling task."""
+        if self._task is None:
+            self.sample()
+            self._samples.clear()
+            self._task = asyncio.create_task(self._run(), name='system-sampler')
+
+    async def stop(self) -> None:
+        """Stop the sampling task."""
+        if self._task is None:
+            return
+
+        self._task.cancel()
+
+        with suppress(asyncio.CancelledError):
+            await self._task
+
+        self._task = None
+
+
+system_sampler = SystemSampler(
+    interval=core_configs.system_metrics_interval,
+    window=core_configs.system_metrics_window,
+)
+on_startup(system_sampler.start)
+on_shutdown(system_sampler.stop)
+
+
+__all__ = [
+    'SystemSampler',
+    'system_sampler',
+]
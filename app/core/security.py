@@ -1,24 +1,31 @@
-import base64
-import datetime as dt
 import hashlib
+import json
 import secrets
+import time
 
-from datetime import (
-    datetime,
-    timedelta,
-)
+from typing import NamedTuple
 from uuid import uuid4
 
 import jwt
 
+from cachetools import TLRUCache
 from jwt.exceptions import (
     ExpiredSignatureError,
     InvalidTokenError,
     PyJWTError,
 )
+from jwt.utils import base64url_encode
 from passlib.context import CryptContext
 
+from app.configs import cache_configs
 from app.configs.core import settings
+from app.core.cache import MeteredCache
+from app.core.executor import BoundedExecutor
+from app.core.keyring import (
+    KeyRing,
+    keyring,
+)
+from app.core.lifespan import on_shutdown
 from app.errors.domain import TokenError
 from app.schemas.enums import TokenType
 
@@ -33,6 +40,36 @@ pwd_context = CryptContext(
     deprecated='auto'
 )
 
+password_hasher = BoundedExecutor(
+    'password-hasher',
+    kind=settings.password_hash_executor,
+    max_workers=settings.password_hash_workers,
+    queue_size=settings.password_hash_queue_size,
+    timeout=settings.password_hash_timeout,
+)
+on_shutdown(password_hasher.shutdown)
+
+
+class VerifiedToken(NamedTuple):
+    payload: dict
+    header: dict
+    expires_at: float
+
+
+def _token_time_to_use(_key: bytes, value: VerifiedToken, _now: float) -> float:
+    return value.expires_at
+
+
+token_cache: MeteredCache[bytes, VerifiedToken] = MeteredCache(
+    'access_tokens',
+    TLRUCache(
+        maxsize=cache_configs.token_cache_size,
+        ttu=_token_time_to_use,
+        timer=time.time,
+    ),
+    enabled=cache_configs.token_cache_enabled,
+)
+
 
 def generate_api_key() -> str:
     return secrets.token_urlsafe(32)
@@ -58,48 +95,156 @@ def verify_password(
     return is_verified, updated_password
 
 
+async def hash_password_async(password: str) -> str:
+    return await password_hasher.run(hash_password, password)
+
+
+async def verify_password_async(
+    password: str,
+    hashed_password: str
+) -> tuple[bool, str | None]:
+    return await password_hasher.run(verify_password, password, hashed_password)
+
+
+class TokenSigner:
+    """Issue and verify JWTs with a single algorithm and key ring.
+
+    Header segments only depend on the key id and the token type, so they are
+    serialized and base64url encoded once and reused for every token. The
+    signature is computed with the PyJWT algorithm implementation directly on
+    the pre-parsed keys of the key ring.
+    """
+
+    def __init__(self, algorithm: str, key_ring: KeyRing) -> None:
+        """Initialize the signer.
+
+        Args:
+            algorithm: JWT algorithm name, e.g. 'ES256', 'EdDSA' or 'HS256'.
+            key_ring: Key ring providing the signing and verification keys.
+        """
+        self.algorithm = algorithm
+        self.key_ring = key_ring
+        self._algorithm = jwt.get_algorithm_by_name(algorithm)
+        self._header_segments: dict[tuple[str, str], bytes] = {}
+
+    def _header_segment(self, kid: str, token_type: TokenType) -> bytes:
+        cache_key = (kid, token_type.value)
+        segment = self._header_segments.get(cache_key)
+
+        if segment is None:
+            header: dict = {
+                'alg': self.algorithm,
+                'kid': kid,
+                'ttyp': token_type.value,
+                'typ': 'JWT',
+            }
+            segment = base64url_encode(
+                json.dumps(header, separators=(',', ':')).encode()
+            )
+            self._header_segments[cache_key] = segment
+
+        return segment
+
+    def sign(self, claims: dict, token_type: TokenType) -> str:
+        """Serialize and sign the given claims.
+
+        Args:
+            claims: JSON serializable token claims.
+            token_type: Type written to the `ttyp` header.
+
+        Returns:
+            The compact serialized JWT.
+        """
+        signing_key = self.key_ring.signing_key
+        signing_input: bytes = b'.'.join((
+            self._header_segment(signing_key.kid, token_type),
+            base64url_encode(json.dumps(claims, separators=(',', ':')).encode()),
+        ))
+        signature: bytes = self._algorithm.sign(signing_input, signing_key.private_key)
+
+        return b'.'.join((signing_input, base64url_encode(signature))).decode()
+
+    def verify(self, token: str, header: dict) -> dict:
+        """Verify the signature and registered claims of a token.
+
+        Args:
+            token: The compact serialized JWT.
+            header: The already decoded, unverified token header.
+
+        Returns:
+            The verified token claims.
+
+        Raises:
+            TokenError: If the key id is unknown.
+            PyJWTError: If the token is invalid or expired.
+        """
+        verify_key = self.key_ring.verify_key(header.get('kid'))
+
+        return jwt.decode(
+            jwt=token,
+            algorithms=[self.algorithm],
+            key=verify_key.public_key,
+            audience=settings.token_audience,
+            issuer=settings.token_issuer,
+            options={
+                'verify_signature': True,
+                'require': ['exp', 'iat', 'nbf', 'iss', 'jti', 'aud']
+            }
+        )
+
+
+token_signer = TokenSigner(settings.token_algorithm, keyring)
+
+
 def _generate_jwt_token(
     data: dict,
     token_type: TokenType,
-    exp_delta: int | None = None
+    exp_delta: int,
+    signer: TokenSigner,
 ) -> str:
-    to_encode = data.copy()
-    expire = datetime.now(dt.UTC) + timedelta(minutes=exp_delta)
+    now = int(time.time())
 
-    to_encode.update({
-        'exp': expire,
-        'nbf': datetime.now(dt.UTC),
+    to_encode: dict = {
+        **data,
+        'exp': now + exp_delta * 60,
+        'nbf': now,
         'iss': settings.token_issuer,
-        'iat': datetime.now(dt.UTC),
-        'sub': to_encode['id'],
+        'iat': now,
+        'sub': data['id'],
         'aud': settings.token_audience,
         'jti': uuid4().hex
-    })
+    }
+
+    return signer.sign(to_encode, token_type)
 
-    return jwt.encode(
-        payload=to_encode,
-        algorithm=settings.token_algorithm,
-        key=base64.b64decode(settings.private_key),
-        headers={'ttyp': token_type.value}
-    )
 
+def generate_tokens(
+    data: dict,
+    signer: TokenSigner | None = None,
+) -> tuple[str, str]:
+    signer = signer or token_signer
 
-def generate_tokens(data: dict) -> tuple[str, str]:
     access_token: str = _generate_jwt_token(
         data=data,
         token_type=TokenType.ACCESS_TOKEN,
-        exp_delta=settings.access_token_exp_delta
+        exp_delta=settings.access_token_exp_delta,
+        signer=signer,
     )
 
     refresh_token: str = _generate_jwt_token(
         data=data,
         token_type=TokenType.REFRESH_TOKEN,
-        exp_delta=settings.refresh_token_exp_delta
+        exp_delta=settings.refresh_token_exp_delta,
+        signer=signer,
     )
 
     return access_token, refresh_token
 
 
+def token_digest(token: str) -> bytes:
+    return hashlib.blake2b(token.encode(), digest_size=32).digest()
+
+
 def decode_jwt_header(token: str) -> dict:
     try:
         header = jwt.get_unverified_header(token)
@@ -114,23 +259,19 @@ def decode_jwt_header(token: str) -> dict:
         raise TokenError(msg) from e
     
 
-def decode_token(token: str) -> dict:
+def decode_token(
+    token: str,
+    header: dict | None = None,
+    signer: TokenSigner | None = None,
+) -> dict:
+    if header is None:
+        header = decode_jwt_header(token)
+
     try:
-        return jwt.decode(
-            jwt=token,
-            algorithms=[settings.token_algorithm],
-            key=base64.b64decode(settings.public_key),
-            audience=settings.token_audience,
-            issuer=settings.token_issuer,
-            options={
-                'verify_signature': True,
-                'require': ['exp', 'iat', 'nbf', 'iss', 'jti', 'aud']
-            }
-        )
+        return (signer or token_signer).verify(token, header)
     except ExpiredSignatureError as e:
         msg: str = 'Token has expired'
         raise TokenError(msg) from e
     except InvalidTokenError as e:
         msg: str = 'Invalid token'
         raise TokenError(msg) from e
-    
\ No newline at end of file
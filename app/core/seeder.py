@@ -6,12 +6,17 @@ from typing import TYPE_CHECKING
 from sqlalchemy.ext.asyncio.session import AsyncSession
 
 from app.configs.seed import settings
-from app.core.security import hash_password
+from app.core.security import (
+    hash_key,
+    hash_password_async,
+)
 from app.db.session import get_session
+from app.repositories.apikey import ServiceApiKeyRepository
 from app.repositories.user import (
     UserProfileRepository,
     UserRepository,
 )
+from app.schemas.enums import ApiKeyScope
 
 
 if TYPE_CHECKING:
@@ -36,7 +41,7 @@ async def seed_initial_user(session: AsyncSession) -> None:
             db_user: UserModel = await user_repo.create({
                 'username': settings.username,
                 'email': settings.email,
-                'password_hash': hash_password(settings.password),
+                'password_hash': await hash_password_async(settings.password),
                 'is_active': True,
                 'is_verified': True,
             })
@@ -53,9 +58,31 @@ async def seed_initial_user(session: AsyncSession) -> None:
     logger.info('sys user already exists.')
 
 
+async def seed_admin_api_key(session: AsyncSession) -> None:
+    if settings.admin_api_key is None:
+        return
+
+    api_key_repo = ServiceApiKeyRepository(session)
+    key_hash: str = hash_key(settings.admin_api_key)
+
+    async with session.begin():
+        if await api_key_repo.find_by_key_hash(key_hash) is not None:
+            logger.info('admin API key already exists.')
+            return
+
+        _ = await api_key_repo.create({
+            'service_name': settings.admin_service_name,
+            'key_hash': key_hash,
+            'scopes': [ApiKeyScope.ADMIN.value],
+        })
+
+    logger.info('admin API key created for %s', settings.admin_service_name)
+
+
 async def main():
     async for session in get_session():
         await seed_initial_user(session)
+        await seed_admin_api_key(session)
 
 if __name__ == '__main__':
     asyncio.run(main())
\ No newline at end of file
@@ -0,0 +1,132 @@
+import asyncio
+import logging
+
+from collections.abc import (
+    Awaitable,
+    Callable,
+)
+from contextlib import suppress
+from itertools import islice
+
+from app.configs import core_configs
+
+
+logger = logging.getLogger(core_configs.logger_name)
+
+
+class WriteBehindBuffer[K, V]:
+    """Coalesce frequent writes in memory and persist them in batches.
+
+    `record` only updates an in-memory mapping, keeping the latest value per
+    key. A background task hands the accumulated mapping to `flush_batch`
+    every `interval` seconds, or earlier once `batch_size` keys are pending,
+    in chunks of at most `batch_size` keys. Batches that fail to persist are
+    merged back so they are retried on the next flush, unless a newer value
+    was recorded in the meantime. The same applies to the batches of a
+    flush that is cancelled, so stopping the buffer never drops entries.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        flush_batch: Callable[[dict[K, V]], Awaitable[object]],
+        *,
+        interval: float,
+        batch_size: int,
+    ) -> None:
+        """Initialize the buffer without starting the background task.
+
+        Args:
+            name: Name used in logs and as the background task name.
+            flush_batch: Coroutine function persisting one batch.
+            interval: Number of seconds between periodic flushes.
+            batch_size: Maximum number of keys per batch.
+        """
+        self.name = name
+        self.interval = interval
+        self.batch_size = batch_size
+
+        self._flush_batch = flush_batch
+        self._pending: dict[K, V] = {}
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+        self.flushed: int = 0
+        self.failed_batches: int = 0
+
+    def record(self, key: K, value: V) -> None:
+        """Remember the latest value for a key until the next flush.
+
+        Args:
+            key: The key identifying the row to update.
+            value: The value to persist.
+        """
+        self._pending[key] = value
+
+        if len(self._pending) >= self.batch_size:
+            self._wakeup.set()
+
+    async def flush(self) -> None:
+        """Persist everything recorded so far."""
+        pending, self._pending = self._pending, {}
+        items = iter(pending.items())
+
+        while batch := dict(islice(items, self.batch_size)):
+            try:
+                await self._flush_batch(batch)
+            except Exception:
+                self.failed_batches += 1
+                logger.exception(
+                    'Failed to flush %d %s entries, retrying later',
+                    len(batch),
+                    self.name,
+                )
+                self._pending = {**batch, **self._pending}
+            except BaseException:
+                # cancelled, e.g. by `stop`: keep the batch and everything not
+                # sent yet so the final flush still persists them
+                self._pending = {**batch, **dict(items), **self._pending}
+                raise
+            else:
+                self.flushed += len(batch)
+
+    async def _run(self) -> None:
+        while True:
+            with suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.interval)
+
+            self._wakeup.clear()
+            await self.flush()
+
+    def stats(self) -> dict:
+        """Return the buffer counters.
+
+        Returns:
+            A dictionary with the number of pending keys, flushed keys and
+            failed batches.
+        """
+        return {
+            'pending': len(self._pending),
+            'flushed': self.flushed,
+            'failed_batches': self.failed_batches,
+        }
+
+    async def start(self) -> None:
+        """Start the periodic flush task."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name=self.name)
+
+    async def stop(self) -> None:
+        """Stop the periodic flush task and flush what is still pending."""
+        if self._task is not None:
+            self._task.cancel()
+
+            with suppress(asyncio.CancelledError):
+                await self._task
+
+            self._task = None
+
+        await self.flush()
+
+
+__all__ = ['WriteBehindBuffer']
@@ -1,3 +1,8 @@
+import asyncio
+import weakref
+
+from contextvars import ContextVar
+from itertools import count
 from typing import Final
 
 from sqlalchemy.engine.url import URL
@@ -12,7 +17,16 @@ from sqlalchemy.ext.asyncio.session import (
 )
 
 from app.configs import db_configs
+from app.core.prometheus import (
+    MetricsSnapshot,
+    register_collector,
+)
 from app.core.request import get_request_id
+from app.db.pool import InstrumentedAsyncPool
+from app.db.routing import (
+    ReplicaSet,
+    RoutingSession,
+)
 
 
 POSTGRES_INDEXES_NAMING_CONVENTION: Final[dict[str, str]] = {
@@ -32,19 +46,176 @@ url_object: URL = URL.create(
     database=db_configs.db_name,
 )
 
-async_engine: AsyncEngine = create_async_engine(
-    url=url_object,
-    echo=False,
-    future=True,
+
+
+def create_engine_for(url: URL) -> AsyncEngine:
+    """Create an async engine with the configured pool and driver settings.
+
+    Args:
+        url: The database URL to connect to.
+
+    Returns:
+        The configured async engine.
+    """
+    return create_async_engine(
+        url=url,
+        echo=False,
+        future=True,
+        poolclass=InstrumentedAsyncPool,
+        pool_size=db_configs.db_pool_size,
+        max_overflow=db_configs.db_max_overflow,
+        pool_timeout=db_configs.db_pool_timeout,
+        pool_recycle=db_configs.db_pool_recycle,
+        pool_pre_ping=db_configs.db_pool_pre_ping,
+        query_cache_size=db_configs.db_query_cache_size,
+        connect_args={
+            'server_settings': db_configs.db_server_settings,
+            'prepared_statement_cache_size': db_configs.db_prepared_statement_cache_size,
+        },
+    )
+
+
+def _replica_url(replica_host: str) -> URL:
+    host, _, port = replica_host.partition(':')
+    return url_object.set(host=host, port=int(port or db_configs.db_port))
+
+
+async_engine: AsyncEngine = create_engine_for(url_object)
+
+replicas: ReplicaSet | None = (
+    ReplicaSet(
+        {
+            replica_host: create_engine_for(_replica_url(replica_host))
+            for replica_host in db_configs.db_replica_hosts
+        },
+        cooldown=db_configs.db_replica_cooldown,
+    )
+    if db_configs.db_replica_hosts
+    else None
 )
 
+all_engines: list[AsyncEngine] = [
+    async_engine,
+    *(replicas.engines.values() if replicas is not None else ()),
+]
+
 async_session_factory = async_sessionmaker(
     bind=async_engine,
     class_=AsyncSession,
+    sync_session_class=RoutingSession,
     expire_on_commit=False,
+    replicas=replicas,
+)
+
+
+
+_task_scopes = count()
+_task_scope: ContextVar[tuple[weakref.ref[asyncio.Task], str] | None] = ContextVar(
+    'task_scope',
+    default=None,
 )
 
+
+def _session_scope() -> str:
+    """Return the key of the scoped session for the current execution flow.
+
+    Sessions are scoped to the current request. Code running outside of a
+    request, such as startup tasks, gets a session per asyncio task instead
+    of sharing a single global one. Task keys are drawn from a counter and
+    kept in a context variable together with a reference to their task, so
+    a key is never reused by another task, neither by a child task that
+    inherited the context nor by a task allocated at the same address.
+
+    Returns:
+        The scope key.
+    """
+    request_id: str | None = get_request_id()
+
+    if request_id is not None:
+        return request_id
+
+    task: asyncio.Task | None = asyncio.current_task()
+    scope = _task_scope.get()
+
+    if scope is not None and scope[0]() is task:
+        return scope[1]
+
+    key: str = f'task-{next(_task_scopes)}'
+
+    if task is not None:
+        _task_scope.set((weakref.ref(task), key))
+
+    return key
+
+
 Session = async_scoped_session(
     session_factory=async_session_factory,
-    scopefunc=get_request_id,
+    scopefunc=_session_scope,
 )
+
+
+def get_pool_stats() -> dict:
+    """Return live statistics of the primary engine connection pool.
+
+    Returns:
+        The pool statistics, see `InstrumentedAsyncPool.stats`.
+    """
+    return async_engine.sync_engine.pool.stats()  # type: ignore[attr-defined]
+
+
+def get_replica_stats() -> dict:
+    """Return the health and pool statistics of the read replicas.
+
+    Returns:
+        The replica statistics by host, empty when no replica is configured.
+    """
+    return replicas.stats() if replicas is not None else {}
+
+
+def get_live_session_count() -> int:
+    """Return the number of sessions currently held by the scoped registry.
+
+    Returns:
+        The number of live scoped sessions. It should stay close to the
+        number of in-flight requests.
+    """
+    return len(Session.registry.registry)  # type: ignore[attr-defined]
+
+
+@register_collector
+def collect_pool_metrics(snapshot: MetricsSnapshot) -> None:
+    """Add the connection pool state of every engine to a snapshot.
+
+    Args:
+        snapshot: The snapshot to add the metrics to.
+    """
+    for engine in all_engines:
+        pool: InstrumentedAsyncPool = engine.sync_engine.pool  # type: ignore[assignment]
+        name: str = 'primary' if engine is async_engine else str(engine.url.host)
+
+        snapshot.gauge('db_pool_size', 'Configured pool size.', pool.size(), engine=name)
+        snapshot.gauge(
+            'db_pool_checked_out',
+            'Connections currently checked out.',
+            pool.checkedout(),
+            engine=name,
+        )
+        snapshot.gauge(
+            'db_pool_overflow',
+            'Connections currently open beyond the pool size.',
+            max(pool.overflow(), 0),
+            engine=name,
+        )
+        snapshot.counter(
+            'db_pool_checkout_timeouts_total',
+            'Checkouts that timed out waiting for a connection.',
+            pool.checkout_timeouts,
+            engine=name,
+        )
+        snapshot.histogram(
+            'db_pool_checkout_wait_seconds',
+            'Time spent waiting for a pool connection.',
+            pool.checkout_wait_ms,
+            0.001,
+            engine=name,
+        )
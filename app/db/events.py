@@ -1,17 +1,150 @@
+import logging
+import sys
+import traceback
+
 from collections.abc import Mapping
+from pathlib import Path
 from time import perf_counter_ns
-from typing import Any
+from typing import (
+    Any,
+    Final,
+)
 
+from greenlet import getcurrent
 from sqlalchemy import event
 from sqlalchemy.engine import Connection
+from sqlalchemy.engine.default import CacheStats
 from sqlalchemy.engine.interfaces import ExecutionContext
 
-from app.core.cache import set_cache
-from app.core.request import get_request_id
-from app.db.base import async_engine
+from app.configs import (
+    core_configs,
+    db_configs,
+)
+from app.core.request import (
+    get_db_stats,
+    get_request_id,
+)
+from app.db.base import all_engines
+from app.db.stats import (
+    fingerprint,
+    query_stats,
+    statement_cache_stats,
+)
+from app.errors.domain import RepeatedQueryError
+
+
+logger = logging.getLogger(core_configs.logger_name)
+
+APP_DIR: Final[str] = str(Path(__file__).resolve().parents[1])
+
+
+def _application_call_sites(limit: int = 5) -> list[str]:
+    """Return the innermost application frames that led to a statement.
+
+    SQLAlchemy's asyncio layer runs the synchronous execution inside a child
+    greenlet, so the awaiting application code lives in the stack of the
+    parent greenlet, which is suspended while the statement executes.
+
+    Args:
+        limit: Maximum number of frames to return.
+
+    Returns:
+        The call sites formatted as `path:line in function`, outermost first.
+    """
+    parent = getcurrent().parent
+    frame = parent.gr_frame if parent is not None else sys._getframe(1)
+
+    return [
+        f'{summary.filename}:{summary.lineno} in {summary.name}'
+        for summary in traceback.extract_stack(frame)
+        if summary.filename.startswith(APP_DIR) and summary.filename != __file__
+    ][-limit:]
+
+
+def _check_repeated_query(statement: str) -> None:
+    """Count a statement against the current request and flag repetitions.
+
+    Once a statement fingerprint is executed more often than the configured
+    threshold within one request, the originating call sites are logged, or
+    a `RepeatedQueryError` is raised in 'raise' mode. Nothing is captured
+    below the threshold, which keeps the overhead to a dictionary update.
+
+    Args:
+        statement: The SQL statement about to be executed.
+
+    Raises:
+        RepeatedQueryError: In 'raise' mode, when the threshold is exceeded.
+    """
+    stats = get_db_stats()
+
+    if stats is None:
+        return
+
+    statement_fingerprint: str = fingerprint(statement)
+    count: int = stats.fingerprint_counts.get(statement_fingerprint, 0) + 1
+    stats.fingerprint_counts[statement_fingerprint] = count
+
+    if count != db_configs.repeated_query_threshold + 1:
+        return
+
+    call_sites: list[str] = _application_call_sites()
+    msg: str = (
+        f'Statement executed more than {db_configs.repeated_query_threshold} '
+        f'times in request {get_request_id()}: {statement_fingerprint}'
+    )
+
+    if db_configs.repeated_query_detection == 'raise':
+        raise RepeatedQueryError(msg, errors=call_sites)
+
+    logger.warning('%s (call sites: %s)', msg, ' <- '.join(reversed(call_sites)))
+
+
+def _record_cache_usage(
+    conn: Connection,
+    statement: str,
+    context: ExecutionContext,
+    executemany: bool,
+) -> None:
+    """Count compiled cache and prepared statement cache hits and misses.
+
+    The compiled cache outcome is reported by SQLAlchemy on the execution
+    context. The prepared statement cache of the asyncpg adapter is keyed by
+    the SQL text and is consulted right after this event, so a statement
+    already present in it is about to be served from it. `executemany` goes
+    through asyncpg directly and bypasses that cache.
+
+    Args:
+        conn: The SQLAlchemy connection being used.
+        statement: The SQL statement about to be executed.
+        context: SQLAlchemy execution context for the statement.
+        executemany: Whether the statement is executed with executemany().
+    """
+    if context.compiled is not None:  # type: ignore[attr-defined]
+        cache_hit = context.cache_hit  # type: ignore[attr-defined]
+
+        if cache_hit is CacheStats.CACHE_HIT:
+            statement_cache_stats.compiled_hits += 1
+        elif cache_hit is CacheStats.CACHE_MISS:
+            statement_cache_stats.compiled_misses += 1
+        else:
+            statement_cache_stats.compiled_uncached += 1
+
+    if executemany:
+        return
+
+    prepared_cache = getattr(
+        conn.connection.dbapi_connection, '_prepared_statement_cache', None
+    )
+
+    if prepared_cache is None:
+        return
+
+    if statement in prepared_cache:
+        statement_cache_stats.prepared_hits += 1
+    else:
+        statement_cache_stats.prepared_misses += 1
 
 
-@event.listens_for(async_engine.sync_engine, 'before_cursor_execute')
 def before_cursor_execute(
     conn: Connection,
     cursor: Any,
@@ -24,7 +157,9 @@ def before_cursor_execute(
 
     This listener runs immediately before the database cursor executes
     a SQL statement. The timestamp is stored on the SQLAlchemy execution
-    context so it can be used later to calculate query duration.
+    context so it can be used later to calculate query duration. Statement
+    cache hits and misses are counted, and when repeated query detection is
+    enabled, the statement is also counted against the current request.
 
     Args:
         conn: The SQLAlchemy connection being used.
@@ -34,11 +169,15 @@ def before_cursor_execute(
         context: SQLAlchemy execution context for the statement.
         executemany: Whether the statement is executed with executemany().
     """
-    _ = conn, cursor, statement, parameters, executemany
+    _ = cursor, parameters
+    _record_cache_usage(conn, statement, context, executemany)
+
+    if db_configs.repeated_query_detection != 'off':
+        _check_repeated_query(statement)
+
     context._query_start_time = perf_counter_ns()
 
 
-@event.listens_for(async_engine.sync_engine, 'after_cursor_execute')
 def after_cursor_execute(
     conn: Connection,
     cursor: Any,
@@ -51,8 +190,10 @@ def after_cursor_execute(
 
     This listener runs immediately after the database cursor finishes
     executing a SQL statement. It calculates the elapsed time using the
-    timestamp recorded in `before_cursor_execute` and stores the result
-    in a request-scoped cache.
+    timestamp recorded in `before_cursor_execute` and records it, together
+    with the reported row count, in the statistics collector of the current
+    request and in the per-fingerprint aggregate. Statements slower than the
+    configured threshold are logged with the current request ID.
 
     Args:
         conn: The SQLAlchemy connection being used.
@@ -62,7 +203,28 @@ def after_cursor_execute(
         context: SQLAlchemy execution context for the statement.
         executemany: Whether the statement was executed with executemany().
     """
-    _ = conn, cursor, statement, parameters, executemany
+    _ = conn, parameters, executemany
     end_time: int = perf_counter_ns()
     duration_ns: int = end_time - context._query_start_time
-    set_cache(get_request_id(), duration_ns)
+    rowcount: int = cursor.rowcount
+    duration_ms: float = duration_ns / 1_000_000
+    statement_fingerprint: str = fingerprint(statement)
+    stats = get_db_stats()
+
+    if stats is not None:
+        stats.record(statement, duration_ns, rowcount)
+
+    query_stats.record(statement_fingerprint, duration_ms, rowcount)
+
+    if duration_ms >= db_configs.slow_query_threshold_ms:
+        logger.warning(
+            'Slow query for request %s took %.4f milliseconds: %s',
+            get_request_id(),
+            duration_ms,
+            statement_fingerprint,
+        )
+
+
+for engine in all_engines:
+    event.listen(engine.sync_engine, 'before_cursor_execute', before_cursor_execute)
+    event.listen(engine.sync_engine, 'after_cursor_execute', after_cursor_execute)
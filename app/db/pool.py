@@ -0,0 +1,114 @@
+from time import (
+    perf_counter_ns,
+    time,
+)
+from typing import Final
+from weakref import WeakSet
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import (
+    AsyncAdaptedQueuePool,
+    ConnectionPoolEntry,
+)
+
+from app.core.metrics import Histogram
+from app.core.request import get_request_id
+
+
+REQUEST_ID_KEY: Final[str] = 'request_id'
+
+
+class InstrumentedAsyncPool(AsyncAdaptedQueuePool):
+    """Async queue pool that measures checkout wait time and connection age.
+
+    The time spent in `_do_get` covers both waiting for a free connection
+    and opening a new one when the pool may still grow, which is what a
+    request experiences as pool latency. Checked out connections are tagged
+    with the current request ID until they are returned, so connections
+    leaked by a request can be detected.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialize the pool and its metrics.
+
+        Args:
+            *args: Positional arguments for `AsyncAdaptedQueuePool`.
+            **kwargs: Keyword arguments for `AsyncAdaptedQueuePool`.
+        """
+        super().__init__(*args, **kwargs)
+        self.checkout_wait_ms = Histogram()
+        self.checkout_timeouts: int = 0
+        self._records: WeakSet[ConnectionPoolEntry] = WeakSet()
+
+    def _create_connection(self) -> ConnectionPoolEntry:
+        record = super()._create_connection()
+        self._records.add(record)
+        return record
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        start_time_ns: int = perf_counter_ns()
+
+        try:
+            record = super()._do_get()
+        except PoolTimeoutError:
+            self.checkout_timeouts += 1
+            raise
+        finally:
+            self.checkout_wait_ms.observe((perf_counter_ns() - start_time_ns) / 1_000_000)
+
+        record.info[REQUEST_ID_KEY] = get_request_id()
+        return record
+
+    def _do_return_conn(self, record: ConnectionPoolEntry) -> None:
+        record.info.pop(REQUEST_ID_KEY, None)
+        super()._do_return_conn(record)  # type: ignore[arg-type]
+
+    def checked_out_by(self, request_id: str) -> int:
+        """Count the connections currently checked out for a request.
+
+        Args:
+            request_id: The request ID to look for.
+
+        Returns:
+            The number of connections checked out while the request ID was
+            set and not returned yet.
+        """
+        return sum(
+            1
+            for record in list(self._records)
+            if record.info.get(REQUEST_ID_KEY) == request_id
+        )
+
+    def stats(self) -> dict:
+        """Return a snapshot of the pool state.
+
+        Returns:
+            A dictionary with the configured size, the checked in, checked
+            out and overflow connection counts, the number of checkout
+            timeouts, the checkout wait time distribution in milliseconds and
+            the age of the open connections in seconds.
+        """
+        now: float = time()
+        ages: list[float] = [
+            now - record.starttime  # type: ignore[attr-defined]
+            for record in list(self._records)
+            if record.dbapi_connection is not None
+        ]
+
+        return {
+            'size': self.size(),
+            'checked_in': self.checkedin(),
+            'checked_out': self.checkedout(),
+            'overflow': self.overflow(),
+            'checkout_timeouts': self.checkout_timeouts,
+            'checkout_wait_ms': self.checkout_wait_ms.snapshot(),
+            'connection_age_s': {
+                'count': len(ages),
+                'min': round(min(ages), 2) if ages else 0.0,
+                'avg': round(sum(ages) / len(ages), 2) if ages else 0.0,
+                'max': round(max(ages), 2) if ages else 0.0,
+            },
+        }
+
+
+__all__ = ['InstrumentedAsyncPool']
@@ -0,0 +1,136 @@
+import asyncio
+import logging
+
+from contextlib import suppress
+from time import (
+    monotonic,
+    perf_counter_ns,
+)
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio.engine import AsyncEngine
+
+from app.configs import (
+    core_configs,
+    db_configs,
+)
+from app.core.lifespan import (
+    on_shutdown,
+    on_startup,
+)
+from app.db.base import async_engine
+
+
+logger = logging.getLogger(core_configs.logger_name)
+
+
+class DatabaseProbe:
+    """Check database availability in the background and cache the result.
+
+    A background task runs `SELECT 1` on its own connection every `interval`
+    seconds. Readiness checks only read the cached result, so probes from
+    load balancers and orchestrators never touch the database themselves.
+    """
+
+    def __init__(self, engine: AsyncEngine, interval: float, timeout: float) -> None:
+        """Initialize the probe without starting the background task.
+
+        Args:
+            engine: The engine to check.
+            interval: Number of seconds between checks.
+            timeout: Number of seconds after which a check fails.
+        """
+        self.engine = engine
+        self.interval = interval
+        self.timeout = timeout
+
+        self.healthy: bool = False
+        self.latency_ms: float | None = None
+        self.error: str | None = None
+        self._checked_at: float | None = None
+        self._task: asyncio.Task | None = None
+
+    async def _select_one(self) -> None:
+        async with self.engine.connect() as connection:
+            await connection.execute(text('SELECT 1'))
+
+    async def check(self) -> bool:
+        """Run one check and cache its outcome.
+
+        Returns:
+            True if the database answered within the timeout; otherwise,
+            False.
+        """
+        start_time_ns: int = perf_counter_ns()
+
+        try:
+            await asyncio.wait_for(self._select_one(), timeout=self.timeout)
+        except (SQLAlchemyError, OSError, TimeoutError) as e:
+            if self.healthy or self._checked_at is None:
+                logger.warning('Database readiness check failed: %r', e)
+
+            self.healthy = False
+            self.latency_ms = None
+            self.error = type(e).__name__
+        else:
+            self.healthy = True
+            self.latency_ms = (perf_counter_ns() - start_time_ns) / 1_000_000
+            self.error = None
+
+        self._checked_at = monotonic()
+        return self.healthy
+
+    def status(self) -> dict:
+        """Return the cached outcome of the latest check.
+
+        Returns:
+            A dictionary with the status, the check latency in milliseconds,
+            the age of the result in seconds and the error type, if any.
+        """
+        return {
+            'status': 'healthy' if self.healthy else 'unhealthy',
+            'response_time_ms': round(self.latency_ms, 3) if self.latency_ms is not None else None,
+            'checked_s_ago': (
+                round(monotonic() - self._checked_at, 3) if self._checked_at is not None else None
+            ),
+            'error': self.error,
+        }
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            await self.check()
+
+    async def start(self) -> None:
+        """Run a first check and start the periodic checks."""
+        if self._task is None:
+            await self.check()
+            self._task = asyncio.create_task(self._run(), name='database-probe')
+
+    async def stop(self) -> None:
+        """Stop the periodic checks."""
+        if self._task is None:
+            return
+
+        self._task.cancel()
+
+        with suppress(asyncio.CancelledError):
+            await self._task
+
+        self._task = None
+
+
+database_probe = DatabaseProbe(
+    async_engine,
+    interval=db_configs.readiness_probe_interval,
+    timeout=db_configs.readiness_probe_timeout,
+)
+on_startup(database_probe.start)
+on_shutdown(database_probe.stop)
+
+
+__all__ = [
+    'DatabaseProbe',
+    'database_probe',
+]
@@ -0,0 +1,256 @@
+import logging
+
+from itertools import count
+from time import monotonic
+from typing import (
+    Any,
+    Final,
+)
+
+from sqlalchemy import event
+from sqlalchemy.engine import (
+    Connection,
+    Engine,
+)
+from sqlalchemy.engine.interfaces import ExceptionContext
+from sqlalchemy.ext.asyncio.engine import AsyncEngine
+from sqlalchemy.ext.asyncio.session import AsyncSession
+from sqlalchemy.orm import (
+    Session,
+    SessionTransaction,
+)
+
+from app.configs import core_configs
+from app.core.cache import MeteredCache
+from app.core.request import get_db_stats
+
+
+logger = logging.getLogger(core_configs.logger_name)
+
+PRIMARY_PINNED_KEY: Final[str] = 'primary_pinned'
+SESSION_USED_KEY: Final[str] = 'used'
+PENDING_INVALIDATIONS_KEY: Final[str] = 'pending_invalidations'
+READ_REPLICA: Final[dict[str, Any]] = {'replica': True}
+
+
+class ReplicaSet:
+    """Read replica engines with round-robin selection and health tracking.
+
+    A replica is considered unhealthy for `cooldown` seconds after a
+    connection level error (refused connection, dropped connection) was
+    raised by one of its connections. Unhealthy replicas are skipped and,
+    when no replica is available, reads fall back to the primary.
+    """
+
+    def __init__(self, engines: dict[str, AsyncEngine], cooldown: float) -> None:
+        """Initialize the replica set and watch the engines for errors.
+
+        Args:
+            engines: Replica engines, by host.
+            cooldown: Number of seconds a failing replica is skipped.
+        """
+        self.engines = engines
+        self.cooldown = cooldown
+
+        self._names: dict[Engine, str] = {
+            engine.sync_engine: name for name, engine in engines.items()
+        }
+        self._unhealthy_until: dict[str, float] = {}
+        self._counter = count()
+
+        for engine in engines.values():
+            event.listen(engine.sync_engine, 'handle_error', self._on_error)
+
+    def _on_error(self, context: ExceptionContext) -> None:
+        if context.is_disconnect or context.connection is None:
+            name: str = self._names[context.engine]  # type: ignore[index]
+            self._unhealthy_until[name] = monotonic() + self.cooldown
+            logger.warning(
+                'Read replica %s marked unhealthy for %.1f seconds: %s',
+                name,
+                self.cooldown,
+                context.original_exception,
+            )
+
+    def is_healthy(self, name: str) -> bool:
+        """Check whether a replica may currently receive reads.
+
+        Args:
+            name: The replica host.
+
+        Returns:
+            True if the replica did not fail within its cooldown period.
+        """
+        return self._unhealthy_until.get(name, 0.0) <= monotonic()
+
+    def choose(self) -> AsyncEngine | None:
+        """Pick the next healthy replica.
+
+        Returns:
+            A replica engine, or None when no replica is healthy.
+        """
+        names: list[str] = [name for name in self.engines if self.is_healthy(name)]
+
+        if not names:
+            return None
+
+        return self.engines[names[next(self._counter) % len(names)]]
+
+    def stats(self) -> dict:
+        """Return the health and pool statistics of every replica.
+
+        Returns:
+            A dictionary with one entry per replica host.
+        """
+        return {
+            name: {
+                'status': 'healthy' if self.is_healthy(name) else 'unhealthy',
+                'pool': engine.sync_engine.pool.stats(),  # type: ignore[attr-defined]
+            }
+            for name, engine in self.engines.items()
+        }
+
+
+class RoutingSession(Session):
+    """Session that sends explicitly marked reads to a read replica.
+
+    Statements executed with `bind_arguments={'replica': True}` are routed to
+    a healthy replica. Everything else, and every read following a write in
+    the same request (or in the same session outside of a request), uses the
+    primary, so a request always reads its own writes.
+    """
+
+    def __init__(self, *args: Any, replicas: ReplicaSet | None = None, **kwargs: Any) -> None:  # noqa: ANN401
+        """Initialize the session.
+
+        Args:
+            *args: Positional arguments for `Session`.
+            replicas: The replicas reads may be routed to, if any.
+            **kwargs: Keyword arguments for `Session`.
+        """
+        super().__init__(*args, **kwargs)
+        self.replicas = replicas
+
+    def pin_to_primary(self) -> None:
+        """Route all further reads of this session and request to the primary."""
+        self.info[PRIMARY_PINNED_KEY] = True
+        stats = get_db_stats()
+
+        if stats is not None:
+            stats.primary_pinned = True
+
+    def is_pinned_to_primary(self) -> bool:
+        """Check whether reads must stay on the primary.
+
+        Returns:
+            True if this session or the current request performed a write.
+        """
+        if self.info.get(PRIMARY_PINNED_KEY, False):
+            return True
+
+        stats = get_db_stats()
+        return stats is not None and stats.primary_pinned
+
+    def get_bind(
+        self,
+        mapper: Any = None,  # noqa: ANN401
+        *,
+        clause: Any = None,  # noqa: ANN401
+        replica: bool = False,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> Engine | Connection:
+        """Return the engine a statement should be executed with.
+
+        Args:
+            mapper: The mapped class or mapper the operation relates to.
+            clause: The statement being executed.
+            replica: Whether the statement may be served by a replica.
+            **kwargs: Additional arguments for `Session.get_bind`.
+
+        Returns:
+            A replica engine for replica reads when one is available;
+            otherwise, the primary bind.
+        """
+        if clause is not None and getattr(clause, 'is_dml', False):
+            self.pin_to_primary()
+        elif replica and self.replicas is not None and not self.is_pinned_to_primary():
+            engine = self.replicas.choose()
+
+            if engine is not None:
+                return engine.sync_engine
+
+        return super().get_bind(mapper, clause=clause, **kwargs)
+
+
+@event.listens_for(RoutingSession, 'after_flush')
+def after_flush(session: RoutingSession, flush_context: Any) -> None:  # noqa: ANN401
+    """Keep reads on the primary once the session has written to it.
+
+    Args:
+        session: The session that was flushed.
+        flush_context: The unit of work of the flush.
+    """
+    _ = flush_context
+    session.pin_to_primary()
+
+
+@event.listens_for(RoutingSession, 'after_begin')
+def after_begin(
+    session: RoutingSession,
+    transaction: Any,  # noqa: ANN401
+    connection: Connection,
+) -> None:
+    """Flag the session as used once it has checked out a connection.
+
+    Args:
+        session: The session that began a transaction.
+        transaction: The session transaction that was begun.
+        connection: The connection the transaction was begun on.
+    """
+    _ = transaction, connection
+    session.info[SESSION_USED_KEY] = True
+
+
+def invalidate_after_transaction(
+    session: Session | AsyncSession,
+    cache: MeteredCache[Any, Any],
+    key: Any,  # noqa: ANN401
+) -> None:
+    """Remove a cache entry once the current transaction has ended.
+
+    Invalidating right after a write leaves a window in which a concurrent
+    request reads the old row, from a replica or before the commit, and
+    caches it again for the whole TTL. The entry is removed when the
+    outermost transaction ends instead; this also happens on rollback,
+    where the removal is merely redundant.
+
+    Args:
+        session: The session the write was issued on.
+        cache: The cache holding the entry.
+        key: The key of the entry to remove.
+    """
+    session.info.setdefault(PENDING_INVALIDATIONS_KEY, []).append((cache, key))
+
+
+@event.listens_for(RoutingSession, 'after_transaction_end')
+def after_transaction_end(session: RoutingSession, transaction: SessionTransaction) -> None:
+    """Apply the cache invalidations collected during the transaction.
+
+    Args:
+        session: The session whose transaction ended.
+        transaction: The transaction that ended.
+    """
+    if transaction.parent is not None:
+        return
+
+    for cache, key in session.info.pop(PENDING_INVALIDATIONS_KEY, ()):
+        cache.pop(key)
+
+
+__all__ = [
+    'READ_REPLICA',
+    'SESSION_USED_KEY',
+    'ReplicaSet',
+    'RoutingSession',
+    'invalidate_after_transaction',
+]
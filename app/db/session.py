@@ -8,9 +8,17 @@ from sqlalchemy.ext.asyncio.session import AsyncSession
 from starlette.status import HTTP_500_INTERNAL_SERVER_ERROR
 
 from app.configs import core_configs
-from app.core.request import get_request_id
-from app.db.base import Session
+from app.core.request import (
+    get_request_id,
+    on_request_end,
+)
+from app.db.base import (
+    Session,
+    all_engines,
+)
 from app.db.events import event  # noqa: F401
+from app.db.routing import SESSION_USED_KEY
+from app.db.stats import session_usage_stats
 
 
 logger = logging.getLogger(core_configs.logger_name)
@@ -24,6 +32,12 @@ async def get_session() -> AsyncGenerator[AsyncSession]:
     when the request processing is complete. It also logs the initialization
     of the session using the current request ID, if available.
 
+    Creating the session is cheap: a connection is only checked out from the
+    pool when the first statement begins a transaction. Whether that happened
+    is recorded when the session is closed, to track how many requests never
+    needed their session. The session is then removed from the scoped
+    registry, so the registry does not grow with every request.
+
     Yields:
         An active asynchronous database session.
 
@@ -36,7 +50,13 @@ async def get_session() -> AsyncGenerator[AsyncSession]:
             logger.info(
                 f'Initialized database session for request: {get_request_id()}.'
             )
-            yield session
+
+            try:
+                yield session
+            finally:
+                session_usage_stats.record(
+                    used=session.info.pop(SESSION_USED_KEY, False)
+                )
     except SQLAlchemyError as e:
         logger.exception(f'Database error: {e}')
         raise HTTPException(
@@ -48,3 +68,43 @@ async def get_session() -> AsyncGenerator[AsyncSession]:
             status_code=e.status_code,
             detail=str(e)
         ) from e
+    finally:
+        await Session.remove()
+
+
+@on_request_end
+async def release_request_resources(request_id: str) -> None:
+    """Tear down the session scope of a finished request and report leaks.
+
+    `get_session` removes its session from the scoped registry when the
+    request is done. A session still registered afterwards was obtained
+    without it and is closed and removed here. Connections still checked
+    out for the request once its session is gone are reported as leaked.
+
+    Args:
+        request_id: The ID of the request that finished.
+    """
+    if Session.registry.has():
+        session: AsyncSession = Session()
+        session_usage_stats.leaked_sessions += 1
+        logger.warning(
+            'Database session of request %s was still open after the response '
+            '(in transaction: %s)',
+            request_id,
+            session.in_transaction(),
+        )
+        await Session.remove()
+
+    leaked_connections: int = sum(
+        engine.sync_engine.pool.checked_out_by(request_id)  # type: ignore[attr-defined]
+        for engine in all_engines
+    )
+
+    if leaked_connections:
+        session_usage_stats.leaked_connections += leaked_connections
+        logger.warning(
+            '%d database connection(s) of request %s were still checked out '
+            'after the response',
+            leaked_connections,
+            request_id,
+        )
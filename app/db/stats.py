@@ -0,0 +1,295 @@
+import re
+
+from functools import lru_cache
+from typing import (
+    Final,
+    Literal,
+)
+
+from app.configs import db_configs
+from app.core.metrics import Histogram
+
+
+type QueryStatsOrder = Literal['total_time', 'mean_time', 'max_time', 'calls', 'rows']
+
+OTHER_FINGERPRINT: Final[str] = '<other>'
+
+_COMMENTS: Final[re.Pattern[str]] = re.compile(r'--[^\n]*|/\*.*?\*/', re.DOTALL)
+_STRINGS: Final[re.Pattern[str]] = re.compile(r"'(?:[^']|'')*'")
+_CASTS: Final[re.Pattern[str]] = re.compile(
+    r'::\s*(?:DOUBLE\s+PRECISION|CHARACTER\s+VARYING|[a-z_][\w.]*)'
+    r'(?:\s*\(\s*\d+(?:\s*,\s*\d+)*\s*\))?'
+    r'(?:\s+(?:WITH|WITHOUT)\s+TIME\s+ZONE)?'
+    r'(?:\s*\[\])*',
+    re.IGNORECASE,
+)
+_CAST_TOKENS: Final[re.Pattern[str]] = re.compile(r'__cast(\d+)__')
+_NUMBERS: Final[re.Pattern[str]] = re.compile(r'(?<![\w$])-?\d+(?:\.\d+)?\b')
+_PARAMS: Final[re.Pattern[str]] = re.compile(r'\$\d+|%\(\w+\)s|(?<!:):\w+\b|\?')
+_LISTS: Final[re.Pattern[str]] = re.compile(
+    r'\(\s*\?(?:\s*::__cast\d+__)?(?:\s*,\s*\?(?:\s*::__cast\d+__)?)*\s*\)'
+)
+_VALUES: Final[re.Pattern[str]] = re.compile(
+    r'(\bVALUES\s*)(\((?:[^()]|\([^()]*\))*\))(?:\s*,\s*\((?:[^()]|\([^()]*\))*\))+',
+    re.IGNORECASE,
+)
+_WHITESPACE: Final[re.Pattern[str]] = re.compile(r'\s+')
+
+
+@lru_cache(maxsize=4096)
+def fingerprint(statement: str) -> str:
+    """Normalize a SQL statement into a literal-free fingerprint.
+
+    Comments are removed, string and numeric literals as well as bind
+    parameters are replaced by `?`, parenthesized lists made up only of
+    placeholders, such as `IN (...)`, are collapsed, repeated `VALUES` rows
+    are reduced to the first one and whitespace is squashed, so that
+    statements differing only in their values share one fingerprint.
+    Type casts, including modifiers like `::CHAR(26)`, are kept as is.
+
+    Statements issued by the application repeat constantly, so results are
+    memoized per statement text.
+
+    Args:
+        statement: The SQL statement as sent to the database.
+
+    Returns:
+        The normalized statement.
+    """
+    casts: list[str] = []
+
+    def protect_cast(match: re.Match[str]) -> str:
+        casts.append(match.group())
+        return f'::__cast{len(casts) - 1}__'
+
+    normalized = _COMMENTS.sub(' ', statement)
+    normalized = _STRINGS.sub('?', normalized)
+    normalized = _CASTS.sub(protect_cast, normalized)
+    normalized = _PARAMS.sub('?', normalized)
+    normalized = _NUMBERS.sub('?', normalized)
+    normalized = _LISTS.sub('(...)', normalized)
+    normalized = _VALUES.sub(r'\1\2, ...', normalized)
+    normalized = _CAST_TOKENS.sub(lambda match: casts[int(match.group(1))][2:].strip(), normalized)
+
+    return _WHITESPACE.sub(' ', normalized).strip()
+
+
+class StatementStats:
+    """Aggregated execution statistics of one statement fingerprint."""
+
+    __slots__ = ('calls', 'rows', 'time_ms')
+
+    def __init__(self) -> None:
+        """Initialize empty statistics."""
+        self.calls: int = 0
+        self.rows: int = 0
+        self.time_ms = Histogram()
+
+    def to_dict(self, statement: str) -> dict:
+        """Summarize the statistics as a JSON serializable dictionary.
+
+        Args:
+            statement: The fingerprint the statistics belong to.
+
+        Returns:
+            A dictionary with call and row counts and the total, mean, p95
+            and maximum execution time in milliseconds.
+        """
+        return {
+            'fingerprint': statement,
+            'calls': self.calls,
+            'rows': self.rows,
+            'total_time_ms': round(self.time_ms.sum, 4),
+            'mean_time_ms': round(self.time_ms.sum / self.calls, 4) if self.calls else 0.0,
+            'p95_time_ms': round(self.time_ms.quantile(0.95), 4),
+            'max_time_ms': round(self.time_ms.max, 4),
+        }
+
+
+_ORDER_KEYS = {
+    'total_time': lambda stats: stats.time_ms.sum,
+    'mean_time': lambda stats: stats.time_ms.sum / stats.calls if stats.calls else 0.0,
+    'max_time': lambda stats: stats.time_ms.max,
+    'calls': lambda stats: stats.calls,
+    'rows': lambda stats: stats.rows,
+}
+
+
+class QueryStats:
+    """In-process aggregate of statement statistics by fingerprint.
+
+    This gives a `pg_stat_statements` like view of the statements issued by
+    this application instance. The number of tracked fingerprints is capped;
+    once the cap is reached, new fingerprints are accounted under
+    `OTHER_FINGERPRINT`.
+    """
+
+    def __init__(self, max_fingerprints: int) -> None:
+        """Initialize an empty aggregate.
+
+        Args:
+            max_fingerprints: Maximum number of distinct fingerprints kept.
+        """
+        self.max_fingerprints = max_fingerprints
+        self._stats: dict[str, StatementStats] = {}
+
+    def record(self, statement_fingerprint: str, duration_ms: float, rowcount: int) -> None:
+        """Account for one executed statement.
+
+        Args:
+            statement_fingerprint: The fingerprint of the executed statement.
+            duration_ms: Execution time in milliseconds.
+            rowcount: Rows returned or affected, negative when unknown.
+        """
+        stats = self._stats.get(statement_fingerprint)
+
+        if stats is None:
+            if len(self._stats) >= self.max_fingerprints:
+                statement_fingerprint = OTHER_FINGERPRINT
+
+            stats = self._stats.setdefault(statement_fingerprint, StatementStats())
+
+        stats.calls += 1
+        stats.time_ms.observe(duration_ms)
+
+        if rowcount > 0:
+            stats.rows += rowcount
+
+    def top(self, limit: int, order_by: QueryStatsOrder = 'total_time') -> list[dict]:
+        """Return the most expensive fingerprints.
+
+        Args:
+            limit: Maximum number of fingerprints to return.
+            order_by: Statistic to sort by, in descending order.
+
+        Returns:
+            The summarized statistics of the top fingerprints.
+        """
+        ranked = sorted(
+            self._stats.items(),
+            key=lambda item: _ORDER_KEYS[order_by](item[1]),
+            reverse=True,
+        )
+        return [stats.to_dict(statement) for statement, stats in ranked[:limit]]
+
+    def reset(self) -> None:
+        """Discard all collected statistics."""
+        self._stats.clear()
+
+
+class StatementCacheStats:
+    """Hit and miss counters of the statement caches on the execution path.
+
+    Two caches are involved: SQLAlchemy's compiled cache, which maps the
+    cache key of a statement construct to its compiled SQL, and asyncpg's
+    per-connection prepared statement cache, which maps the SQL text to a
+    server-side prepared statement.
+    """
+
+    __slots__ = (
+        'compiled_hits',
+        'compiled_misses',
+        'compiled_uncached',
+        'prepared_hits',
+        'prepared_misses',
+    )
+
+    def __init__(self) -> None:
+        """Initialize all counters to zero."""
+        self.compiled_hits: int = 0
+        self.compiled_misses: int = 0
+        self.compiled_uncached: int = 0
+        self.prepared_hits: int = 0
+        self.prepared_misses: int = 0
+
+    def to_dict(self) -> dict:
+        """Summarize the counters as a JSON serializable dictionary.
+
+        Returns:
+            A dictionary with the hits, misses and hit ratio of both caches.
+            Compiled statements that could not be cached at all are
+            reported separately as `uncached`.
+        """
+        compiled_lookups: int = self.compiled_hits + self.compiled_misses
+        prepared_lookups: int = self.prepared_hits + self.prepared_misses
+
+        return {
+            'compiled': {
+                'hits': self.compiled_hits,
+                'misses': self.compiled_misses,
+                'uncached': self.compiled_uncached,
+                'hit_ratio': round(self.compiled_hits / compiled_lookups, 4) if compiled_lookups else 0.0,
+            },
+            'prepared': {
+                'hits': self.prepared_hits,
+                'misses': self.prepared_misses,
+                'hit_ratio': round(self.prepared_hits / prepared_lookups, 4) if prepared_lookups else 0.0,
+            },
+        }
+
+
+class SessionUsageStats:
+    """Counters of request sessions and of those that touched the database.
+
+    A session only checks out a connection when it begins a transaction on
+    its first statement, so sessions that are closed unused never take a
+    connection from the pool. The ratio shows how many requests depend on a
+    session without needing one. Sessions and connections still open after
+    a response was sent are counted as leaked.
+    """
+
+    __slots__ = ('leaked_connections', 'leaked_sessions', 'opened', 'used')
+
+    def __init__(self) -> None:
+        """Initialize all counters to zero."""
+        self.opened: int = 0
+        self.used: int = 0
+        self.leaked_sessions: int = 0
+        self.leaked_connections: int = 0
+
+    def record(self, *, used: bool) -> None:
+        """Account for one closed session.
+
+        Args:
+            used: Whether the session began a transaction on a connection.
+        """
+        self.opened += 1
+
+        if used:
+            self.used += 1
+
+    def to_dict(self) -> dict:
+        """Summarize the counters as a JSON serializable dictionary.
+
+        Returns:
+            A dictionary with the number of opened, used and unused
+            sessions, the share of unused sessions and the number of leaked
+            sessions and connections.
+        """
+        unused: int = self.opened - self.used
+
+        return {
+            'opened': self.opened,
+            'used': self.used,
+            'unused': unused,
+            'unused_ratio': round(unused / self.opened, 4) if self.opened else 0.0,
+            'leaked_sessions': self.leaked_sessions,
+            'leaked_connections': self.leaked_connections,
+        }
+
+
+query_stats = QueryStats(max_fingerprints=db_configs.query_stats_max_fingerprints)
+statement_cache_stats = StatementCacheStats()
+session_usage_stats = SessionUsageStats()
+
+
+__all__ = [
+    'QueryStats',
+    'QueryStatsOrder',
+    'SessionUsageStats',
+    'StatementCacheStats',
+    'fingerprint',
+    'query_stats',
+    'session_usage_stats',
+    'statement_cache_stats',
+]
@@ -12,4 +12,13 @@ class BaseError(Exception):
         super().__init__(message)
 
 class TokenError(BaseError):
+    pass
+
+class WorkerPoolBusyError(BaseError):
+    pass
+
+class WorkerPoolTimeoutError(BaseError):
+    pass
+
+class RepeatedQueryError(BaseError):
     pass
\ No newline at end of file
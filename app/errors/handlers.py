@@ -1,61 +1,81 @@
+import logging
+
 from fastapi.exceptions import (
     HTTPException,
     RequestValidationError,
 )
 from fastapi.requests import Request
-from fastapi.responses import JSONResponse
 from pydantic import ValidationError
-from starlette.status import HTTP_422_UNPROCESSABLE_ENTITY
+from starlette.status import (
+    HTTP_422_UNPROCESSABLE_ENTITY,
+    HTTP_500_INTERNAL_SERVER_ERROR,
+)
 
+from app.configs import core_configs
+from app.core.responses import ModelJSONResponse
+from app.errors.domain import BaseError
 from app.schemas.response import ResponseModel
-from app.utils.helpers import json_encode_response_model
+
+
+logger = logging.getLogger(core_configs.logger_name)
 
 
 async def http_exception_handler(
     request: Request,
     e: HTTPException,
-) -> JSONResponse:
+) -> ModelJSONResponse:
     _ = request
     content = ResponseModel(status=e.status_code, success=False, message=e.detail)
 
-    return JSONResponse(
-        status_code=content.status,
-        content=json_encode_response_model(content),
-        headers=e.headers,
-    )
+    return ModelJSONResponse(content, headers=e.headers, exclude_none=False)
 
 
 async def schema_validation_error_handler(
     request: Request,
     e: ValidationError,
-) -> JSONResponse:
+) -> ModelJSONResponse:
     _ = request
     content = ResponseModel(
         status=HTTP_422_UNPROCESSABLE_ENTITY,
         success=False,
         message=f'{e.title.lower()} model validation failed with {str(e.error_count())} errors.',
-        errors=json_encode_response_model(e.errors()),
+        errors=e.errors(),
     )
 
-    return JSONResponse(
-        status_code=content.status,
-        content=json_encode_response_model(content),
-    )
+    return ModelJSONResponse(content, exclude_none=False)
 
 
 async def request_validation_error_handler(
     request: Request,
     e: RequestValidationError,
-) -> JSONResponse:
+) -> ModelJSONResponse:
     _ = request
     content = ResponseModel(
         status=HTTP_422_UNPROCESSABLE_ENTITY,
         success=False,
         message='request body validation failed.',
-        errors=json_encode_response_model(e.errors()),
+        errors=e.errors(),
     )
 
-    return JSONResponse(
-        status_code=content.status,
-        content=json_encode_response_model(content),
+    return ModelJSONResponse(content, exclude_none=False)
+
+
+async def domain_error_handler(
+    request: Request,
+    e: BaseError,
+) -> ModelJSONResponse:
+    logger.error(
+        'Unhandled %s on %s %s: %s',
+        type(e).__name__,
+        request.method,
+        request.url.path,
+        e.message,
+    )
+    content = ResponseModel(
+        status=HTTP_500_INTERNAL_SERVER_ERROR,
+        success=False,
+        message=e.message,
+        errors=e.errors,
     )
+
+    return ModelJSONResponse(content, exclude_none=False)
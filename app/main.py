@@ -8,7 +8,10 @@ from pydantic import ValidationError
 from app.api import v1_router
 from app.core.lifespan import lifespan
 from app.core.middlewares import AddRequestIdMiddleware
+from app.core.responses import ModelJSONResponse
+from app.errors.domain import BaseError
 from app.errors.handlers import (
+    domain_error_handler,
     http_exception_handler,
     request_validation_error_handler,
     schema_validation_error_handler,
@@ -16,12 +19,13 @@ from app.errors.handlers import (
 
 
 api_prefix: str = '/api'
-app = FastAPI(lifespan=lifespan)
+app = FastAPI(lifespan=lifespan, default_response_class=ModelJSONResponse)
 
 app.add_middleware(AddRequestIdMiddleware)
 
 app.add_exception_handler(HTTPException, http_exception_handler)
 app.add_exception_handler(RequestValidationError, request_validation_error_handler)
 app.add_exception_handler(ValidationError, schema_validation_error_handler)
+app.add_exception_handler(BaseError, domain_error_handler)
 
 app.include_router(v1_router, prefix=api_prefix)
@@ -1,5 +1,17 @@
 import inspect as property_inspect
 
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import (
+    cache,
+    lru_cache,
+)
+from operator import attrgetter
+from typing import (
+    Any,
+    ClassVar,
+)
+
 from sqlalchemy import MetaData
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.inspection import inspect as column_inspect
@@ -8,59 +20,173 @@ from sqlalchemy.orm import DeclarativeBase
 from app.db.base import POSTGRES_INDEXES_NAMING_CONVENTION
 
 
-class Base(DeclarativeBase):
-    metadata = MetaData(
-        naming_convention=POSTGRES_INDEXES_NAMING_CONVENTION, schema=None
-    )
+def _compile_getter(names: tuple[str, ...]) -> Callable[[Any], tuple]:
+    if not names:
+        return lambda _: ()
 
-    __table_args__ = {'schema': None}
+    if len(names) == 1:
+        getter = attrgetter(names[0])
+        return lambda instance: (getter(instance),)
 
-    def get_model_columns(self):
-        return [column.key for column in column_inspect(self).mapper.column_attrs]
+    return attrgetter(*names)
 
-    def get_model_properties(self):
-        return [
-            name
-            for name in dir(self)
-            if isinstance(property_inspect.getattr_static(self, name), property)
-        ]
 
-    def get_model_hybrid_properties(self):
-        return [
-            name
-            for name in dir(self)
-            if isinstance(property_inspect.getattr_static(self, name), hybrid_property)
-        ]
+def _as_name_set(value: Any, argument: str) -> frozenset[str] | None:  # noqa: ANN401
+    if not value:
+        return None
 
-    def get_columns_and_properties(self):
-        columns = self.get_model_columns()
-        properties = self.get_model_properties()
-        hybrid_properties = self.get_model_hybrid_properties()
+    if not isinstance(value, list | tuple | set | frozenset):
+        raise TypeError(f"The '{argument}' argument must be a valid list, set or None")
 
-        return [*columns, *properties, *hybrid_properties]
+    return frozenset(value)
 
-    def to_dict(self, include: list | None = None, exclude: list | None = None):
-        if bool(include) and not isinstance(include, list):
-            raise TypeError("The 'include' argument must be a valid list or None")
 
-        if bool(exclude) and not isinstance(exclude, list):
-            raise TypeError("The 'exclude' argument must be a valid list or None")
+@dataclass(frozen=True, slots=True)
+class ModelSerializer:
+    """Attribute names and compiled getters converting instances of a model.
 
-        result = {}
+    Columns hold plain values and are read with a single `attrgetter` call;
+    properties and hybrid properties may return other models, which are
+    converted recursively.
+    """
 
-        for column in self.get_columns_and_properties():
-            if include and column not in include:
-                continue
-            if exclude and column in exclude:
-                continue
+    columns: tuple[str, ...]
+    properties: tuple[str, ...]
+    get_columns: Callable[[Any], tuple]
+    get_properties: Callable[[Any], tuple]
 
-            value = getattr(self, column)
+    @classmethod
+    def compile(cls, columns: tuple[str, ...], properties: tuple[str, ...]) -> 'ModelSerializer':
+        """Compile the getters of the given attributes.
 
+        Args:
+            columns: The names of the column attributes.
+            properties: The names of the properties and hybrid properties.
+
+        Returns:
+            The serializer.
+        """
+        return cls(columns, properties, _compile_getter(columns), _compile_getter(properties))
+
+    def __call__(self, instance: 'Base') -> dict:
+        """Convert a model instance to a dictionary.
+
+        Args:
+            instance: The instance to convert.
+
+        Returns:
+            The attribute values by name.
+        """
+        result: dict = dict(zip(self.columns, self.get_columns(instance), strict=True))
+
+        for name, value in zip(self.properties, self.get_properties(instance), strict=True):
             if isinstance(value, Base):
-                result[column] = value.to_dict()
+                result[name] = value.to_dict()
             elif isinstance(value, list) and value and isinstance(value[0], Base):
-                result[column] = [item.to_dict() for item in value]
+                result[name] = [item.to_dict() for item in value]
             else:
-                result[column] = value
+                result[name] = value
 
         return result
+
+    def many(self, instances: list['Base']) -> list[dict]:
+        """Convert a list of instances of the model to dictionaries.
+
+        Args:
+            instances: The instances to convert.
+
+        Returns:
+            The attribute values by name of every instance.
+        """
+        if self.properties:
+            return [self(instance) for instance in instances]
+
+        columns, get_columns = self.columns, self.get_columns
+        return [dict(zip(columns, get_columns(instance), strict=True)) for instance in instances]
+
+
+class Base(DeclarativeBase):
+    metadata = MetaData(
+        naming_convention=POSTGRES_INDEXES_NAMING_CONVENTION, schema=None
+    )
+
+    __table_args__ = {'schema': None}
+
+    # fetch server generated values with INSERT/UPDATE ... RETURNING on flush
+    __mapper_args__: ClassVar[dict[str, Any]] = {'eager_defaults': True}
+
+    @classmethod
+    @cache
+    def get_model_columns(cls) -> tuple[str, ...]:
+        return tuple(column.key for column in column_inspect(cls).column_attrs)
+
+    @classmethod
+    @cache
+    def get_model_properties(cls) -> tuple[str, ...]:
+        return tuple(
+            name
+            for name in dir(cls)
+            if isinstance(property_inspect.getattr_static(cls, name), property)
+        )
+
+    @classmethod
+    @cache
+    def get_model_hybrid_properties(cls) -> tuple[str, ...]:
+        return tuple(
+            name
+            for name in dir(cls)
+            if isinstance(property_inspect.getattr_static(cls, name), hybrid_property)
+        )
+
+    @classmethod
+    def get_columns_and_properties(cls) -> tuple[str, ...]:
+        return (
+            *cls.get_model_columns(),
+            *cls.get_model_properties(),
+            *cls.get_model_hybrid_properties(),
+        )
+
+    @classmethod
+    @lru_cache(maxsize=256)
+    def get_serializer(
+        cls,
+        include: frozenset[str] | None = None,
+        exclude: frozenset[str] | None = None,
+    ) -> ModelSerializer:
+        def selected(names: tuple[str, ...]) -> tuple[str, ...]:
+            return tuple(
+                name
+                for name in names
+                if (include is None or name in include) and (exclude is None or name not in exclude)
+            )
+
+        return ModelSerializer.compile(
+            selected(cls.get_model_columns()),
+            selected((*cls.get_model_properties(), *cls.get_model_hybrid_properties())),
+        )
+
+    def to_dict(
+        self,
+        include: list | set | frozenset | tuple | None = None,
+        exclude: list | set | frozenset | tuple | None = None,
+    ) -> dict:
+        serializer = type(self).get_serializer(
+            _as_name_set(include, 'include'),
+            _as_name_set(exclude, 'exclude'),
+        )
+
+        return serializer(self)
+
+    @classmethod
+    def to_dicts(
+        cls,
+        instances: list['Base'],
+        include: list | set | frozenset | tuple | None = None,
+        exclude: list | set | frozenset | tuple | None = None,
+    ) -> list[dict]:
+        serializer = cls.get_serializer(
+            _as_name_set(include, 'include'),
+            _as_name_set(exclude, 'exclude'),
+        )
+
+        return serializer.many(instances)
@@ -91,6 +91,7 @@ class UserModel(Base):
         back_populates='user',
         uselist=False,
         cascade='all, delete-orphan',
+        lazy='raise_on_sql',
     )
 
 
@@ -139,4 +140,5 @@ class UserProfileModel(Base):
 
     user: Mapped['UserModel'] = relationship(
         back_populates='user_profile',
+        lazy='raise_on_sql',
     )
\ No newline at end of file
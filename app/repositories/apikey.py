@@ -1,8 +1,64 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+from cachetools import TTLCache
+from sqlalchemy import (
+    column,
+    func,
+    insert,
+    select,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import (
+    CHAR,
+    TIMESTAMP,
+)
 from sqlalchemy.ext.asyncio.session import AsyncSession
 
+from app.configs import cache_configs
+from app.core.cache import MeteredCache
+from app.db.routing import invalidate_after_transaction
 from app.models.apikey import ServiceApiKeyModel
 
 
+@dataclass(frozen=True, slots=True)
+class CachedApiKey:
+    id: str
+    service_name: str
+    scopes: frozenset[str]
+    is_active: bool
+
+    @classmethod
+    def from_model(cls, db_data: ServiceApiKeyModel) -> 'CachedApiKey':
+        return cls(
+            id=db_data.id,
+            service_name=db_data.service_name,
+            scopes=frozenset(db_data.scopes),
+            is_active=db_data.is_active,
+        )
+
+
+api_key_cache: MeteredCache[str, CachedApiKey] = MeteredCache(
+    'api_keys',
+    TTLCache(
+        maxsize=cache_configs.api_key_cache_size,
+        ttl=cache_configs.api_key_cache_ttl,
+    ),
+    enabled=cache_configs.api_key_cache_enabled,
+)
+
+# remembers hashes that matched no key, so guessing does not hit the database
+unknown_api_key_cache: MeteredCache[str, bool] = MeteredCache(
+    'api_keys_unknown',
+    TTLCache(
+        maxsize=cache_configs.api_key_cache_size,
+        ttl=cache_configs.api_key_negative_cache_ttl,
+    ),
+    enabled=cache_configs.api_key_cache_enabled,
+)
+
+
 class ServiceApiKeyRepository:
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
@@ -16,6 +72,92 @@ class ServiceApiKeyRepository:
         self.session.add(db_data)
 
         await self.session.flush()
-        await self.session.refresh(db_data)
+
+        invalidate_after_transaction(self.session, unknown_api_key_cache, db_data.key_hash)
 
         return db_data
+
+    async def create_many(
+        self,
+        data: list[dict],
+    ) -> list[ServiceApiKeyModel]:
+        if not data:
+            return []
+
+        results = await self.session.scalars(
+            insert(ServiceApiKeyModel).returning(
+                ServiceApiKeyModel,
+                sort_by_parameter_order=True,
+            ),
+            data,
+        )
+        db_data = list(results.all())
+
+        for db_key in db_data:
+            invalidate_after_transaction(self.session, unknown_api_key_cache, db_key.key_hash)
+
+        return db_data
+
+    async def find_by_key_hash(
+        self,
+        key_hash: str,
+    ) -> ServiceApiKeyModel | None:
+        stmt = (
+            select(ServiceApiKeyModel)
+            .where(
+                ServiceApiKeyModel.key_hash == key_hash
+            )
+        )
+
+        results = await self.session.scalars(stmt)
+        return results.one_or_none()
+
+    async def find_cached_by_key_hash(
+        self,
+        key_hash: str,
+    ) -> CachedApiKey | None:
+        cached_key = api_key_cache.get(key_hash)
+
+        if cached_key is not None:
+            return cached_key
+
+        if unknown_api_key_cache.get(key_hash):
+            return None
+
+        db_data = await self.find_by_key_hash(key_hash)
+
+        if db_data is None:
+            unknown_api_key_cache.set(key_hash, value=True)
+            return None
+
+        cached_key = CachedApiKey.from_model(db_data)
+        api_key_cache.set(key_hash, cached_key)
+
+        return cached_key
+
+    async def touch_last_used(
+        self,
+        last_used: dict[str, datetime],
+    ) -> None:
+        usage = values(
+            column('id', CHAR(26)),
+            column('last_used_at', TIMESTAMP(timezone=True)),
+            name='usage',
+        ).data(list(last_used.items()))
+
+        stmt = (
+            update(ServiceApiKeyModel)
+            .where(
+                ServiceApiKeyModel.id == usage.c.id
+            )
+            .values(
+                # GREATEST skips NULL, so a never used key takes the new value
+                last_used_at=func.greatest(
+                    ServiceApiKeyModel.last_used_at,
+                    usage.c.last_used_at,
+                ),
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+        await self.session.execute(stmt)
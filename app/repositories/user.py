@@ -1,15 +1,90 @@
+from dataclasses import (
+    dataclass,
+    field,
+)
+
+from cachetools import TTLCache
 from sqlalchemy import (
+    func,
+    insert,
+    lambda_stmt,
     or_,
     select,
+    update,
 )
 from sqlalchemy.ext.asyncio.session import AsyncSession
+from sqlalchemy.orm import selectinload
 
+from app.configs import cache_configs
+from app.core.cache import MeteredCache
+from app.db.routing import (
+    READ_REPLICA,
+    invalidate_after_transaction,
+)
 from app.models.user import (
     UserModel,
     UserProfileModel,
 )
 
 
+@dataclass(frozen=True, slots=True)
+class CachedUser:
+    id: str
+    email: str
+    is_active: bool
+    is_verified: bool
+    is_deleted: bool
+
+    # columns selected by projections, in field order
+    columns = (
+        UserModel.id,
+        UserModel.email,
+        UserModel.is_active,
+        UserModel.is_verified,
+        UserModel.is_deleted,
+    )
+
+    @classmethod
+    def from_model(cls, db_user: UserModel) -> 'CachedUser':
+        return cls(
+            id=db_user.id,
+            email=db_user.email,
+            is_active=db_user.is_active,
+            is_verified=db_user.is_verified,
+            is_deleted=db_user.is_deleted,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class UserCredentials:
+    id: str
+    email: str
+    password_hash: str = field(repr=False)
+    is_active: bool
+    is_verified: bool
+    is_deleted: bool
+
+    # columns selected by projections, in field order
+    columns = (
+        UserModel.id,
+        UserModel.email,
+        UserModel.password_hash,
+        UserModel.is_active,
+        UserModel.is_verified,
+        UserModel.is_deleted,
+    )
+
+
+user_cache: MeteredCache[str, CachedUser] = MeteredCache(
+    'users',
+    TTLCache(
+        maxsize=cache_configs.user_cache_size,
+        ttl=cache_configs.user_cache_ttl,
+    ),
+    enabled=cache_configs.user_cache_enabled,
+)
+
+
 class UserRepository:
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
@@ -23,27 +98,84 @@ class UserRepository:
         self.session.add(db_data)
 
         await self.session.flush()
-        await self.session.refresh(db_data)
 
         return db_data
 
+    async def create_many(
+        self,
+        data: list[dict],
+    ) -> list[UserModel]:
+        if not data:
+            return []
+
+        results = await self.session.scalars(
+            insert(UserModel).returning(
+                UserModel,
+                sort_by_parameter_order=True,
+            ),
+            data,
+        )
+        return list(results.all())
+
     async def find_by_id(
         self,
         user_id: str,
+        *,
+        with_profile: bool = False,
     ) -> UserModel | None:
-        stmt = (
-            select(UserModel)
+        stmt = lambda_stmt(
+            lambda: select(UserModel)
             .where(
                 UserModel.id == user_id
             )
         )
 
-        results = await self.session.scalars(stmt)
+        if with_profile:
+            stmt += lambda s: s.options(selectinload(UserModel.user_profile))
+
+        results = await self.session.scalars(stmt, bind_arguments=READ_REPLICA)
         return results.unique().one_or_none()
-    
+
+    async def find_summary_by_id(
+        self,
+        user_id: str,
+    ) -> CachedUser | None:
+        stmt = lambda_stmt(
+            lambda: select(*CachedUser.columns)
+            .where(
+                UserModel.id == user_id,
+                UserModel.is_deleted.is_(False),
+            )
+        )
+
+        results = await self.session.execute(stmt, bind_arguments=READ_REPLICA)
+        row = results.one_or_none()
+
+        return CachedUser(*row) if row is not None else None
+
+    async def find_cached_by_id(
+        self,
+        user_id: str,
+    ) -> CachedUser | None:
+        cached_user = user_cache.get(user_id)
+
+        if cached_user is not None:
+            return cached_user
+
+        cached_user = await self.find_summary_by_id(user_id)
+
+        if cached_user is None:
+            return None
+
+        user_cache.set(user_id, cached_user)
+
+        return cached_user
+
     async def find_by_email(
         self,
         email: str,
+        *,
+        with_profile: bool = False,
     ) -> UserModel | None:
         stmt = (
             select(UserModel)
@@ -52,16 +184,20 @@ class UserRepository:
             )
         )
 
-        results = await self.session.scalars(stmt)
+        if with_profile:
+            stmt = stmt.options(selectinload(UserModel.user_profile))
+
+        results = await self.session.scalars(stmt, bind_arguments=READ_REPLICA)
         return results.unique().one_or_none()
-    
-    
+
     async def find_by_identifier(
         self,
         identifier: str,
+        *,
+        with_profile: bool = False,
     ) -> UserModel | None:
-        stmt = (
-            select(UserModel)
+        stmt = lambda_stmt(
+            lambda: select(UserModel)
             .where(
                 or_(
                     UserModel.email == identifier,
@@ -71,9 +207,31 @@ class UserRepository:
             )
         )
 
-        results = await self.session.scalars(stmt)
+        if with_profile:
+            stmt += lambda s: s.options(selectinload(UserModel.user_profile))
+
+        results = await self.session.scalars(stmt, bind_arguments=READ_REPLICA)
         return results.unique().one_or_none()
-    
+
+    async def find_credentials_by_identifier(
+        self,
+        identifier: str,
+    ) -> UserCredentials | None:
+        stmt = lambda_stmt(
+            lambda: select(*UserCredentials.columns)
+            .where(
+                or_(
+                    UserModel.email == identifier,
+                    UserModel.username == identifier,
+                ),
+                UserModel.is_deleted.is_(False),
+            )
+        )
+
+        results = await self.session.execute(stmt, bind_arguments=READ_REPLICA)
+        row = results.one_or_none()
+
+        return UserCredentials(*row) if row is not None else None
 
     async def update(
         self,
@@ -81,24 +239,50 @@ class UserRepository:
         updated_data: dict,
     ) -> UserModel | None:
         stmt = (
-            select(UserModel)
+            update(UserModel)
             .where(
                 UserModel.id == user_id,
                 UserModel.is_deleted.is_(False),
             )
+            .values({'updated_at': func.now(), **updated_data})
+            .returning(UserModel)
+            .execution_options(populate_existing=True)
         )
 
         results = await self.session.scalars(stmt)
-        db_user = results.unique().one_or_none()
-
-        if db_user:
-            for field, value in updated_data.items():
-                setattr(db_user, field, value)
+        db_user = results.one_or_none()
 
-            await self.session.refresh(db_user)
+        invalidate_after_transaction(self.session, user_cache, user_id)
 
         return db_user
 
+    async def update_many(
+        self,
+        user_ids: list[str],
+        updated_data: dict,
+    ) -> list[UserModel]:
+        if not user_ids:
+            return []
+
+        stmt = (
+            update(UserModel)
+            .where(
+                UserModel.id.in_(user_ids),
+                UserModel.is_deleted.is_(False),
+            )
+            .values({'updated_at': func.now(), **updated_data})
+            .returning(UserModel)
+            .execution_options(populate_existing=True)
+        )
+
+        results = await self.session.scalars(stmt)
+        db_users = list(results.all())
+
+        for user_id in user_ids:
+            invalidate_after_transaction(self.session, user_cache, user_id)
+
+        return db_users
+
 
 class UserProfileRepository:
     def __init__(self, session: AsyncSession) -> None:
@@ -113,6 +297,21 @@ class UserProfileRepository:
         self.session.add(db_data)
 
         await self.session.flush()
-        await self.session.refresh(db_data)
 
-        return db_data
\ No newline at end of file
+        return db_data
+
+    async def create_many(
+        self,
+        data: list[dict],
+    ) -> list[UserProfileModel]:
+        if not data:
+            return []
+
+        results = await self.session.scalars(
+            insert(UserProfileModel).returning(
+                UserProfileModel,
+                sort_by_parameter_order=True,
+            ),
+            data,
+        )
+        return list(results.all())
\ No newline at end of file
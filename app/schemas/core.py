@@ -1,14 +1,45 @@
 from typing import TypedDict
 
 
+class SystemSample(TypedDict):
+    """Represents one sample of system and process resource usage.
+
+    Counts are floats so the same shape can hold window averages.
+
+    Attributes:
+        cpu_percent (float): System-wide CPU usage percentage.
+        memory_percent (float): System-wide memory usage percentage.
+        process_cpu_percent (float): CPU usage percentage of this process.
+        process_rss_mb (float): Resident set size of this process, in MiB.
+        open_fds (float): Open file descriptors (handles on Windows).
+        threads (float): Number of threads of this process.
+        loop_lag_ms (float): Event loop scheduling delay, in milliseconds.
+    """
+
+    cpu_percent: float
+    memory_percent: float
+    process_cpu_percent: float
+    process_rss_mb: float
+    open_fds: float
+    threads: float
+    loop_lag_ms: float
+
+
 class SystemMetrics(TypedDict):
     """Represents system resource usage metrics.
 
     Attributes:
         cpu_usage (str): CPU usage percentage (e.g., "42%").
         memory_usage (str): Memory usage percentage (e.g., "73%").
+        sample_age_s (float | None): Seconds since the latest sample.
+        latest (SystemSample | None): The latest sample, if any.
+        averages (SystemSample | None): Averages over the sample window.
+        window_s (float): Time span covered by the averaged samples.
     """
 
     cpu_usage: str
     memory_usage: str
-    
\ No newline at end of file
+    sample_age_s: float | None
+    latest: SystemSample | None
+    averages: SystemSample | None
+    window_s: float
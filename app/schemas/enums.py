@@ -49,4 +49,11 @@ class TokenType(BaseEnum):
 @unique
 class GrantType(BaseEnum):
     PASSWORD = 'password'
-    REFRESH_TOKEN = 'refresh_token'
\ No newline at end of file
+    REFRESH_TOKEN = 'refresh_token'
+
+
+@unique
+class ApiKeyScope(BaseEnum):
+    """Permissions an API key can be granted."""
+
+    ADMIN = 'admin'
@@ -0,0 +1,27 @@
+from typing import Annotated
+
+from fastapi import (
+    Query,
+    Security,
+)
+from starlette.status import HTTP_200_OK
+
+from app.db.stats import (
+    QueryStatsOrder,
+    query_stats,
+)
+from app.repositories.apikey import CachedApiKey
+from app.schemas.enums import ApiKeyScope
+from app.schemas.response import ResponseModel
+from app.services.apikey import validate_api_key
+
+
+def get_query_stats(
+    _: Annotated[CachedApiKey, Security(validate_api_key, scopes=[ApiKeyScope.ADMIN.value])],
+    limit: Annotated[int, Query(ge=1, le=500)] = 20,
+    order_by: QueryStatsOrder = 'total_time',
+) -> ResponseModel:
+    return ResponseModel.create_model(
+        status=HTTP_200_OK,
+        payload=query_stats.top(limit=limit, order_by=order_by),
+    )
@@ -1,17 +1,39 @@
+import datetime as dt
+
+from datetime import datetime
 from typing import (
     TYPE_CHECKING,
     Annotated,
 )
 
 from fastapi import Depends
+from fastapi.exceptions import HTTPException
+from fastapi.security import (
+    APIKeyHeader,
+    SecurityScopes,
+)
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio.session import AsyncSession
-from starlette.status import HTTP_200_OK
+from starlette.status import (
+    HTTP_200_OK,
+    HTTP_401_UNAUTHORIZED,
+    HTTP_403_FORBIDDEN,
+)
 
+from app.configs import db_configs
+from app.core.lifespan import (
+    on_shutdown,
+    on_startup,
+)
 from app.core.security import hash_key
+from app.core.writebehind import WriteBehindBuffer
+from app.db.base import async_session_factory
 from app.db.session import get_session
 from app.db.utils import handle_db_errors
-from app.repositories.apikey import ServiceApiKeyRepository
+from app.repositories.apikey import (
+    CachedApiKey,
+    ServiceApiKeyRepository,
+)
 from app.schemas.apikey import (
     RequestApiKeySchema,
     ResponseApiKeySchema,
@@ -24,6 +46,24 @@ if TYPE_CHECKING:
     from app.models.apikey import ServiceApiKeyModel
 
 
+api_key_header = APIKeyHeader(name='X-API-Key', auto_error=False)
+
+
+async def _flush_last_used(last_used: dict[str, datetime]) -> None:
+    async with async_session_factory() as session, session.begin():
+        await ServiceApiKeyRepository(session).touch_last_used(last_used)
+
+
+api_key_usage = WriteBehindBuffer(
+    'api-key-usage',
+    _flush_last_used,
+    interval=db_configs.api_key_usage_flush_interval,
+    batch_size=db_configs.api_key_usage_batch_size,
+)
+on_startup(api_key_usage.start)
+on_shutdown(api_key_usage.stop)
+
+
 async def create_api_key(
     session: Annotated[AsyncSession, Depends(get_session)],
     token_returns: Annotated[tuple[dict, dict], Depends(validate_access_token)],
@@ -67,3 +107,55 @@ async def create_api_key(
             message=f'{err.message} - service_name: {request_data.service_name} already exists.',
             errors=err.errors
         )
+
+
+async def validate_api_key(
+    security_scopes: SecurityScopes,
+    api_key: Annotated[str | None, Depends(api_key_header)],
+    session: Annotated[AsyncSession, Depends(get_session)],
+) -> CachedApiKey:
+    if not api_key:
+        raise HTTPException(
+            status_code=HTTP_401_UNAUTHORIZED,
+            detail='Missing API key',
+            headers={'WWW-Authenticate': 'APIKey'}
+        )
+
+    repo = ServiceApiKeyRepository(session)
+
+    try:
+        async with session.begin():
+            db_key = await repo.find_cached_by_key_hash(hash_key(api_key))
+    except SQLAlchemyError as e:
+        err = await handle_db_errors(e)
+        raise HTTPException(
+            status_code=err.status_code,
+            detail=err.message,
+        ) from e
+
+    if db_key is None:
+        raise HTTPException(
+            status_code=HTTP_401_UNAUTHORIZED,
+            detail='The provided API key is invalid',
+            headers={'WWW-Authenticate': 'APIKey'}
+        )
+
+    if not db_key.is_active:
+        raise HTTPException(
+            status_code=HTTP_403_FORBIDDEN,
+            detail='The provided API key is inactive',
+            headers={'WWW-Authenticate': 'APIKey'}
+        )
+
+    missing_scopes = set(security_scopes.scopes).difference(db_key.scopes)
+
+    if missing_scopes:
+        raise HTTPException(
+            status_code=HTTP_403_FORBIDDEN,
+            detail=f'API key is missing required scopes: {sorted(missing_scopes)}',
+            headers={'WWW-Authenticate': f'APIKey scope="{security_scopes.scope_str}"'}
+        )
+
+    api_key_usage.record(db_key.id, datetime.now(dt.UTC))
+
+    return db_key
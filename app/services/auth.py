@@ -10,18 +10,26 @@ from starlette.status import (
     HTTP_400_BAD_REQUEST,
     HTTP_401_UNAUTHORIZED,
     HTTP_403_FORBIDDEN,
+    HTTP_503_SERVICE_UNAVAILABLE,
 )
 
 from app.configs.core import settings
 from app.core.security import (
+    VerifiedToken,
     decode_jwt_header,
     decode_token,
     generate_tokens,
-    verify_password,
+    token_cache,
+    token_digest,
+    verify_password_async,
 )
 from app.db.session import get_session
 from app.db.utils import handle_db_errors
-from app.errors.domain import TokenError
+from app.errors.domain import (
+    TokenError,
+    WorkerPoolBusyError,
+    WorkerPoolTimeoutError,
+)
 from app.repositories.user import UserRepository
 from app.schemas.auth import LoginRequestSchema
 from app.schemas.enums import (
@@ -29,10 +37,7 @@ from app.schemas.enums import (
     TokenType,
 )
 from app.schemas.response import ResponseModel
-from app.schemas.user import (
-    UserCredentialsSchema,
-    UserSchema,
-)
+from app.schemas.user import UserCredentialsSchema
 
 
 oauth2_schema = OAuth2PasswordBearer(tokenUrl='/oauth/token')
@@ -62,29 +67,43 @@ async def validate_access_token(
     token: Annotated[str, Depends(oauth2_schema)],
     session: Annotated[AsyncSession, Depends(get_session)],
 ) -> tuple[dict, dict]:
-    try:
-        header: dict = decode_jwt_header(token)
+    cache_key: bytes = token_digest(token)
+    verified_token: VerifiedToken | None = token_cache.get(cache_key)
 
-        if header.get('ttyp') != TokenType.ACCESS_TOKEN.value:
+    if verified_token is None:
+        try:
+            header: dict = decode_jwt_header(token)
+
+            if header.get('ttyp') != TokenType.ACCESS_TOKEN.value:
+                raise HTTPException(
+                    status_code=HTTP_400_BAD_REQUEST,
+                    detail='Invalid token type. Expected an access token',
+                    headers={'WWW-Authenticate': 'Bearer'}
+                )
+
+            payload: dict = decode_token(token, header)
+        except TokenError as e:
             raise HTTPException(
                 status_code=HTTP_400_BAD_REQUEST,
-                detail='Invalid token type. Expected an access token',
+                detail=e.message,
                 headers={'WWW-Authenticate': 'Bearer'}
-            )
-        
-        payload: dict = decode_token(token)
-    except TokenError as e:
-        raise HTTPException(
-            status_code=HTTP_400_BAD_REQUEST,
-            detail=e.message,
-            headers={'WWW-Authenticate': 'Bearer'}
-        ) from e
-    
+            ) from e
+
+        verified_token = VerifiedToken(
+            payload=payload,
+            header=header,
+            expires_at=payload['exp'],
+        )
+        token_cache.set(cache_key, verified_token)
+
+    # hand out copies so callers cannot mutate the cached claims
+    payload, header = dict(verified_token.payload), dict(verified_token.header)
+
     repo = UserRepository(session)
 
     try:
         async with session.begin(): 
-            db_user = await repo.find_by_id(payload['id'])
+            db_user = await repo.find_cached_by_id(payload['id'])
     except SQLAlchemyError as e:
         err = await handle_db_errors(e)
         return ResponseModel.create_model(
@@ -99,7 +118,14 @@ async def validate_access_token(
             detail='The provided token is invalid or expired',
             headers={'WWW-Authenticate': 'Bearer'}
         )
-    
+
+    if not db_user.is_active:
+        raise HTTPException(
+            status_code=HTTP_403_FORBIDDEN,
+            detail='User account is inactive. Please contact support.',
+            headers={'WWW-Authenticate': 'Bearer'}
+        )
+
     return payload, header
 
 
@@ -114,7 +140,7 @@ def _refresh_token_login(token: str) -> ResponseModel:
                 headers={'WWW-Authenticate': 'Bearer'}
             )
         
-        payload: dict = decode_token(token)
+        payload: dict = decode_token(token, header)
 
         to_encode: dict = {
             'id': payload['id'],
@@ -148,7 +174,7 @@ async def _password_login(
 
     async with session.begin():
         try:
-            db_user = await repo.find_by_identifier(credentials.identifier)
+            db_user = await repo.find_credentials_by_identifier(credentials.identifier)
         except SQLAlchemyError as e:
             err = await handle_db_errors(e)
             return ResponseModel.create_model(
@@ -164,10 +190,17 @@ async def _password_login(
                 headers={'WWW-Authenticate': 'Bearer'}
             )
 
-        verified, updated_pwd = verify_password(
-            password=credentials.password,
-            hashed_password=db_user.password_hash
-        )
+        try:
+            verified, updated_pwd = await verify_password_async(
+                password=credentials.password,
+                hashed_password=db_user.password_hash
+            )
+        except (WorkerPoolBusyError, WorkerPoolTimeoutError) as e:
+            raise HTTPException(
+                status_code=HTTP_503_SERVICE_UNAVAILABLE,
+                detail='Authentication service is busy. Please retry shortly.',
+                headers={'Retry-After': '1'}
+            ) from e
 
         if not verified:
             raise HTTPException(
@@ -176,28 +209,23 @@ async def _password_login(
                 headers={'WWW-Authenticate': 'Bearer'}
             )
 
-        user_data = UserSchema.model_validate(db_user.to_dict())
-
-        if not user_data.is_verified:
+        if not db_user.is_verified:
             raise HTTPException(
                 status_code=HTTP_403_FORBIDDEN,
                 detail='User account is not verified. Please verify your account to proceed.',
                 headers={'WWW-Authenticate': 'Bearer'}
             )
 
-        if not user_data.is_active:
+        if not db_user.is_active:
             raise HTTPException(
                 status_code=HTTP_403_FORBIDDEN,
                 detail='User account is inactive. Please contact support.',
                 headers={'WWW-Authenticate': 'Bearer'}
             )
 
-        
-        updated_pwd = db_user.password_hash
-        
         if updated_pwd is not None:
             try:
-                db_user = await repo.update(
+                await repo.update(
                     user_id=db_user.id,
                     updated_data={
                         'password_hash': updated_pwd
@@ -1,11 +1,29 @@
+from math import ceil
 from typing import Annotated
 
 from fastapi import Depends
-from sqlalchemy.ext.asyncio.session import AsyncSession
-from starlette.status import HTTP_200_OK
+from fastapi.exceptions import HTTPException
+from starlette.status import (
+    HTTP_200_OK,
+    HTTP_429_TOO_MANY_REQUESTS,
+    HTTP_503_SERVICE_UNAVAILABLE,
+)
 
-from app.db.session import get_session
-from app.db.utils import get_db_response_time_ms
+from app.configs import core_configs
+from app.core.cache import get_cache_stats
+from app.core.loopmonitor import loop_monitor
+from app.core.ratelimit import TokenBucket
+from app.core.security import password_hasher
+from app.db.base import (
+    get_live_session_count,
+    get_pool_stats,
+    get_replica_stats,
+)
+from app.db.probe import database_probe
+from app.db.stats import (
+    session_usage_stats,
+    statement_cache_stats,
+)
 from app.schemas.core import SystemMetrics
 from app.schemas.response import ResponseModel
 from app.utils import (
@@ -14,12 +32,49 @@ from app.utils import (
 )
 
 
-def health_check_v1(
-    session: Annotated[AsyncSession, Depends(get_session)],
+diagnostics_rate_limiter = TokenBucket(
+    rate=core_configs.diagnostics_rate_limit,
+    capacity=core_configs.diagnostics_burst,
+)
+
+
+async def liveness_check_v1() -> ResponseModel:
+    return ResponseModel.create_model(
+        status=HTTP_200_OK,
+        payload={'api': 'alive'},
+    )
+
+
+async def readiness_check_v1() -> ResponseModel:
+    ready: bool = database_probe.healthy
+
+    return ResponseModel.create_model(
+        status=HTTP_200_OK if ready else HTTP_503_SERVICE_UNAVAILABLE,
+        payload={
+            'api': 'ready' if ready else 'not ready',
+            'dependencies': {
+                'database': database_probe.status(),
+            },
+        },
+    )
+
+
+async def limit_diagnostics_rate() -> None:
+    if not diagnostics_rate_limiter.try_acquire():
+        raise HTTPException(
+            status_code=HTTP_429_TOO_MANY_REQUESTS,
+            detail='Too many diagnostics requests.',
+            headers={'Retry-After': str(ceil(diagnostics_rate_limiter.retry_after()))},
+        )
+
+
+async def diagnostics_v1(
+    rate_limit: Annotated[None, Depends(limit_diagnostics_rate)],
     uptime: Annotated[str, Depends(get_api_uptime)],
     system_metrics: Annotated[SystemMetrics, Depends(get_system_metrics)],
-    db_response_time: Annotated[str, Depends(get_db_response_time_ms)],
 ) -> ResponseModel:
+    _ = rate_limit
+
     return ResponseModel.create_model(
         status=HTTP_200_OK,
         payload={
@@ -27,10 +82,21 @@ def health_check_v1(
             'version': '1.0.0',
             'uptime': uptime,
             'system_metrics': system_metrics,
+            'event_loop': loop_monitor.stats(),
+            'caches': get_cache_stats(),
+            'workers': {
+                'password_hasher': password_hasher.stats(),
+            },
             'dependencies': {
                 'database': {
-                    'status': 'healthy' if session.is_active else 'unhealthy',
-                    'response_time_ms': db_response_time,
+                    **database_probe.status(),
+                    'pool': get_pool_stats(),
+                    'statement_cache': statement_cache_stats.to_dict(),
+                    'replicas': get_replica_stats(),
+                    'sessions': {
+                        **session_usage_stats.to_dict(),
+                        'live': get_live_session_count(),
+                    },
                 }
             },
         },
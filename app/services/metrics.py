@@ -0,0 +1,5 @@
+from app.core.prometheus import metrics_exporter
+
+
+async def get_metrics_v1() -> str:
+    return await metrics_exporter.render()
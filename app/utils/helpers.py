@@ -2,22 +2,13 @@ import re
 import unicodedata
 
 from time import perf_counter_ns
-from typing import TYPE_CHECKING
 
 from fastapi import Request
-from fastapi.encoders import jsonable_encoder
-from psutil import (
-    cpu_percent,
-    virtual_memory,
-)
 
+from app.core.sampler import system_sampler
 from app.schemas.core import SystemMetrics
 
 
-if TYPE_CHECKING:
-    from app.schemas.response import ResponseModel
-
-
 def get_api_uptime(request: Request) -> str:
     """Return the API uptime as a human-readable string.
 
@@ -53,18 +44,21 @@ def get_api_uptime(request: Request) -> str:
 
 
 def get_system_metrics() -> SystemMetrics:
-    """Retrieve current system CPU and memory usage metrics.
+    """Retrieve the latest system and process resource usage metrics.
+
+    The metrics are collected in the background by `system_sampler`, so
+    this performs no system calls.
 
     Returns:
-        dict: A dictionary containing system usage metrics with percentage
-        values as strings.
+        dict: A dictionary containing system usage metrics.
             - cpu_usage (str): CPU usage percentage (e.g., "42%").
             - memory_usage (str): Memory usage percentage (e.g., "73%").
+            - sample_age_s (float | None): Seconds since the latest sample.
+            - latest (dict | None): The latest sample.
+            - averages (dict | None): Averages over the sample window.
+            - window_s (float): Time span covered by the averages.
     """
-    return {
-        'cpu_usage': f'{cpu_percent()}%',
-        'memory_usage': f'{virtual_memory().percent}%',
-    }
+    return system_sampler.metrics()
 
 
 def clean_text(text: str) -> str:
@@ -76,14 +70,3 @@ def clean_text(text: str) -> str:
         .strip()
         .split()
     )
-
-
-def json_encode_response_model(
-    response: 'ResponseModel | list | dict',
-    *,
-    exclude_none: bool = False,
-) -> dict:
-    if isinstance(response, (list, dict)):
-        return jsonable_encoder(obj=response, exclude_none=exclude_none)
-
-    return response.model_dump(mode='json', exclude_none=exclude_none)
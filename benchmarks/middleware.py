@@ -0,0 +1,125 @@
+"""Compare request throughput of the request ID middleware implementations.
+
+The previous `BaseHTTPMiddleware` based implementation is reproduced here so
+both can be measured against the same minimal application, driven directly
+through the ASGI interface without any network or server overhead:
+
+    python -m benchmarks.middleware --requests 20000
+"""
+
+import argparse
+import asyncio
+import logging
+
+from collections.abc import (
+    Awaitable,
+    Callable,
+)
+from time import perf_counter
+from uuid import uuid4
+
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import (
+    PlainTextResponse,
+    Response,
+)
+from starlette.routing import Route
+from starlette.types import (
+    Message,
+    Scope,
+)
+
+from app.configs import core_configs
+from app.core.middlewares import AddRequestIdMiddleware
+from app.core.request import (
+    remove_request_id,
+    set_request_id,
+)
+
+
+logging.basicConfig(level=logging.INFO, format='%(message)s')
+logger = logging.getLogger('benchmarks.middleware')
+
+
+class LegacyRequestIdMiddleware(BaseHTTPMiddleware):
+    """The former `BaseHTTPMiddleware` implementation, kept for comparison."""
+
+    async def dispatch(
+        self,
+        request: Request,
+        call_next: Callable[[Request], Awaitable[Response]],
+    ) -> Response:
+        """Attach a request ID the way the previous implementation did."""
+        request_id: str = uuid4().hex
+        request.state.request_id = request_id
+        ctx_token = await set_request_id(request_id)
+        response = await call_next(request)
+        await remove_request_id(ctx_token)
+        return response
+
+
+async def _endpoint(request: Request) -> PlainTextResponse:
+    return PlainTextResponse(request.state.request_id)
+
+
+def _build_app(middleware_class: type) -> Starlette:
+    return Starlette(
+        routes=[Route('/', _endpoint)],
+        middleware=[Middleware(middleware_class)],
+    )
+
+
+async def _drive(app: Starlette, requests: int) -> float:
+    """Send `requests` GET requests through the app and return requests/sec."""
+    scope: Scope = {
+        'type': 'http',
+        'asgi': {'version': '3.0'},
+        'http_version': '1.1',
+        'method': 'GET',
+        'scheme': 'http',
+        'path': '/',
+        'raw_path': b'/',
+        'root_path': '',
+        'query_string': b'',
+        'headers': [(b'host', b'bench')],
+        'client': ('127.0.0.1', 1234),
+        'server': ('bench', 80),
+    }
+
+    async def receive() -> Message:
+        return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+    async def send(message: Message) -> None:
+        _ = message
+
+    start: float = perf_counter()
+    for _ in range(requests):
+        await app({**scope, 'state': {}}, receive, send)
+
+    return requests / (perf_counter() - start)
+
+
+def main() -> None:
+    """Parse the command line and report the throughput of both versions."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--requests', type=int, default=10_000)
+    args = parser.parse_args()
+
+    # keep per-request log lines out of the measurement for both variants
+    logging.getLogger(core_configs.logger_name).setLevel(logging.WARNING)
+
+    for name, middleware_class in (
+        ('BaseHTTPMiddleware', LegacyRequestIdMiddleware),
+        ('pure ASGI', AddRequestIdMiddleware),
+    ):
+        throughput: float = asyncio.run(
+            _drive(_build_app(middleware_class), args.requests)
+        )
+        logger.info('%-20s %10.0f requests/s', name, throughput)
+
+
+if __name__ == '__main__':
+    main()
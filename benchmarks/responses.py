@@ -0,0 +1,116 @@
+"""Compare the cost of rendering the response envelope.
+
+The previous path dumps the `ResponseModel` into a dictionary and lets
+`JSONResponse` encode it with the stdlib `json` module; `ModelJSONResponse`
+serializes the model to bytes in a single pass. Both are measured on a small
+payload, like a token response, and on a larger diagnostics-like payload:
+
+    python -m benchmarks.responses --iterations 20000
+"""
+
+import argparse
+import logging
+
+from collections.abc import Callable
+from time import perf_counter_ns
+
+from starlette.responses import JSONResponse
+
+from app.core.responses import ModelJSONResponse
+from app.schemas.response import ResponseModel
+
+
+logging.basicConfig(level=logging.INFO, format='%(message)s')
+logger = logging.getLogger('benchmarks.responses')
+
+
+def _token_payload() -> dict:
+    return {
+        'access_token': 'a' * 280,
+        'refresh_token': 'r' * 280,
+        'token_type': 'Bearer',
+        'expires_in': 86_400,
+    }
+
+
+def _diagnostics_payload() -> dict:
+    histogram: dict = {
+        'count': 1_000,
+        'mean': 1.25,
+        'p50': 1.0,
+        'p95': 2.5,
+        'p99': 5.0,
+        'max': 9.8,
+    }
+
+    return {
+        'api': 'healthy',
+        'version': '1.0.0',
+        'caches': {
+            f'cache_{index}': {
+                'enabled': True,
+                'size': 10,
+                'hits': 100,
+                'misses': 3,
+                'hit_ratio': 0.97,
+            }
+            for index in range(4)
+        },
+        'queries': [
+            {
+                'fingerprint': 'SELECT * FROM users WHERE id = ?',
+                'calls': index,
+                'time_ms': histogram,
+            }
+            for index in range(50)
+        ],
+    }
+
+
+def _legacy(model: ResponseModel) -> bytes:
+    return JSONResponse(
+        status_code=model.status, content=model.model_dump(exclude_none=True)
+    ).body
+
+
+def _model(model: ResponseModel) -> bytes:
+    return ModelJSONResponse(model).body
+
+
+def _measure(
+    render: Callable[[ResponseModel], bytes], model: ResponseModel, iterations: int
+) -> float:
+    """Render the model `iterations` times and return microseconds per response."""
+    start_ns: int = perf_counter_ns()
+
+    for _ in range(iterations):
+        render(model)
+
+    return (perf_counter_ns() - start_ns) / iterations / 1_000
+
+
+def main() -> None:
+    """Parse the command line and report the rendering cost of both paths."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--iterations', type=int, default=10_000)
+    args = parser.parse_args()
+
+    for payload_name, payload in (
+        ('token', _token_payload()),
+        ('diagnostics', _diagnostics_payload()),
+    ):
+        model = ResponseModel.create_model(payload=payload)
+        legacy_us: float = _measure(_legacy, model, args.iterations)
+        model_us: float = _measure(_model, model, args.iterations)
+
+        logger.info(
+            '%-12s model_dump + json: %8.2f us   ModelJSONResponse: %8.2f us   (%.1fx)',
+            payload_name,
+            legacy_us,
+            model_us,
+            legacy_us / model_us,
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+"""Measure token issuing and verification throughput per signing algorithm.
+
+Run from the project root with the usual environment (`.env`) in place:
+
+    python -m benchmarks.tokens --iterations 2000
+"""
+
+import argparse
+import logging
+import secrets
+
+from time import perf_counter
+
+from cryptography.hazmat.primitives.asymmetric import (
+    ec,
+    ed25519,
+)
+
+from app.core.keyring import (
+    JwtKey,
+    KeyRing,
+)
+from app.core.security import (
+    TokenSigner,
+    decode_token,
+    generate_tokens,
+)
+
+
+logging.basicConfig(level=logging.INFO, format='%(message)s')
+logger = logging.getLogger('benchmarks.tokens')
+
+
+def _build_signer(algorithm: str) -> TokenSigner:
+    """Create a signer backed by a freshly generated key for `algorithm`."""
+    if algorithm == 'HS256':
+        secret: bytes = secrets.token_bytes(32)
+        key = JwtKey(kid='bench', public_key=secret, private_key=secret)
+    elif algorithm == 'EdDSA':
+        private_key = ed25519.Ed25519PrivateKey.generate()
+        key = JwtKey(
+            kid='bench', public_key=private_key.public_key(), private_key=private_key
+        )
+    else:
+        private_key = ec.generate_private_key(ec.SECP256R1())
+        key = JwtKey(
+            kid='bench', public_key=private_key.public_key(), private_key=private_key
+        )
+
+    return TokenSigner(algorithm, KeyRing.from_keys(algorithm, [key]))
+
+
+def run(algorithm: str, iterations: int) -> tuple[float, float]:
+    """Benchmark a single algorithm.
+
+    Args:
+        algorithm: The JWT algorithm to benchmark.
+        iterations: Number of `generate_tokens` and `decode_token` calls.
+
+    Returns:
+        Issued tokens per second and verified tokens per second.
+    """
+    signer = _build_signer(algorithm)
+    data: dict = {'id': '01J0000000000000000000000', 'email': 'bench@example.com'}
+
+    start: float = perf_counter()
+    tokens: list[str] = []
+    for _ in range(iterations):
+        access_token, _refresh_token = generate_tokens(data, signer=signer)
+        tokens.append(access_token)
+    # every generate_tokens call issues an access and a refresh token
+    issued_per_sec: float = 2 * iterations / (perf_counter() - start)
+
+    start = perf_counter()
+    for token in tokens:
+        decode_token(token, signer=signer)
+    verified_per_sec: float = iterations / (perf_counter() - start)
+
+    return issued_per_sec, verified_per_sec
+
+
+def main() -> None:
+    """Parse the command line and report the results for each algorithm."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--iterations', type=int, default=1000)
+    parser.add_argument('--algorithms', nargs='+', default=['ES256', 'EdDSA', 'HS256'])
+    args = parser.parse_args()
+
+    logger.info('%-8s %16s %16s', 'alg', 'issue tokens/s', 'verify tokens/s')
+    for algorithm in args.algorithms:
+        issued, verified = run(algorithm, args.iterations)
+        logger.info('%-8s %16.0f %16.0f', algorithm, issued, verified)
+
+
+if __name__ == '__main__':
+    main()